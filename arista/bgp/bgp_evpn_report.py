@@ -1,7 +1,163 @@
 from srlinux.syntax import Syntax
 from srlinux.location import build_path
 from srlinux.mgmt.cli import KeyCompleter
+from collections import OrderedDict
 import datetime
+import ipaddress
+import itertools
+import time
+
+
+class AttrSetCache:
+    """Process-wide LRU cache of decoded attr-sets keyed by (network-instance, attr_id)."""
+
+    def __init__(self, max_entries=50000, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, netinst_name, attr_id):
+        """Return the cached attr-set fields or None if missing or expired"""
+        key = (netinst_name, attr_id)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, netinst_name, attr_id, attrs):
+        """Store attr-set fields, evicting the least recently used entries"""
+        key = (netinst_name, attr_id)
+        self._entries[key] = (time.monotonic(), attrs)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        """Return the cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (100.0 * self.hits / lookups) if lookups else 0.0
+        }
+
+
+# Shared by every report instance so attr-sets survive across commands
+ATTR_SET_CACHE = AttrSetCache()
+
+
+# rib-in-post container, indexed by the bgp_rib_afi_safi_list_for_evpn feature
+RIB_IN_POST_PATHS = {
+    True: '/network-instance[name={name}]/bgp-rib/afi-safi[afi-safi-name=evpn]/evpn/rib-in-out/rib-in-post',
+    False: '/network-instance[name={name}]/bgp-rib/evpn/rib-in-out/rib-in-post',
+}
+
+
+def _compile_route_type(name, list_name, keys, network):
+    """Pre-build the rib-in-post path templates and list attributes of an EVPN route type"""
+    key_template = ''.join(f'[{key}={{{key.replace("-", "_")}}}]' for key in keys)
+    legacy_list_name = list_name + 's'
+    return {
+        'name': name,
+        'keys': keys,
+        'path': {
+            True: RIB_IN_POST_PATHS[True] + '/' + list_name + key_template,
+            False: RIB_IN_POST_PATHS[False] + '/' + legacy_list_name + key_template,
+        },
+        'list': {
+            True: list_name.replace('-', '_'),
+            False: legacy_list_name.replace('-', '_'),
+        },
+        'network': network
+    }
+
+
+class EvpnHostIndex:
+    """Short-lived MAC, IP and ESI index of the mac-ip routes of each network-instance."""
+
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        self._indexes = {}
+
+    def get(self, netinst_name):
+        """Return the index of a network-instance or None if missing or expired"""
+        index = self._indexes.get(netinst_name)
+        if index is None or time.monotonic() - index['built'] > self.ttl:
+            return None
+        return index
+
+    def build(self, netinst_name, hosts):
+        """Index host entries by MAC, IP and ESI"""
+        index = {'built': time.monotonic(), 'mac': {}, 'ip': {}, 'esi': {}}
+        for host in hosts:
+            index['mac'].setdefault(host['mac'], []).append(host)
+            if host['ip']:
+                index['ip'].setdefault(host['ip'], []).append(host)
+            if host['esi']:
+                index['esi'].setdefault(host['esi'], []).append(host)
+        self._indexes[netinst_name] = index
+        return index
+
+
+# Reused by consecutive 'show bgp evpn host' commands within the TTL
+HOST_INDEX = EvpnHostIndex()
+
+# Zero ESI and unspecified addresses of mac-only routes are not indexed
+NULL_ESI = '00:00:00:00:00:00:00:00:00:00'
+NULL_IPS = ('0.0.0.0', '::')
+
+
+# EVPN route type registry, built once when the plugin is loaded
+EVPN_ROUTE_TYPES = {
+    '1': _compile_route_type(
+        'auto-discovery', 'ethernet-ad-route',
+        ('route-distinguisher', 'esi', 'ethernet-tag-id', 'neighbor'),
+        lambda route: 'RD: ' + route.route_distinguisher + ' auto-discovery ' + str(route.ethernet_tag_id) + ' ' + route.esi),
+    '2': _compile_route_type(
+        'mac-ip', 'mac-ip-route',
+        ('route-distinguisher', 'mac-length', 'mac-address', 'ip-address', 'ethernet-tag-id', 'neighbor'),
+        lambda route: 'RD: ' + route.route_distinguisher + ' mac-ip ' + route.mac_address + ' ' + route.ip_address),
+    '3': _compile_route_type(
+        'imet', 'imet-route',
+        ('route-distinguisher', 'originating-router', 'ethernet-tag-id', 'neighbor'),
+        lambda route: 'RD: ' + route.route_distinguisher + ' imet ' + route.originating_router),
+    '4': _compile_route_type(
+        'ethernet-segment', 'ethernet-segment-route',
+        ('route-distinguisher', 'esi', 'originating-router', 'neighbor'),
+        lambda route: 'RD: ' + route.route_distinguisher + ' ethernet-segment ' + route.esi),
+    '5': _compile_route_type(
+        'ip-prefix', 'ip-prefix-route',
+        ('route-distinguisher', 'ethernet-tag-id', 'ip-prefix-length', 'ip-prefix', 'neighbor'),
+        lambda route: 'RD: ' + route.route_distinguisher + ' ip-prefix ' + route.ip_prefix),
+}
+
+# Resolved on first use, system features do not change during a CLI session
+_evpn_afi_safi_list = None
+
+
+def evpn_afi_safi_list(state):
+    """Return whether the EVPN RIB is modelled under the afi-safi list"""
+    global _evpn_afi_safi_list
+    if _evpn_afi_safi_list is None:
+        _evpn_afi_safi_list = bool(state.system_features.bgp_rib_afi_safi_list_for_evpn)
+    return _evpn_afi_safi_list
+
 
 class IpBgpReport:
     """Handles the 'show bgp evpn summary' command functionality."""
@@ -9,6 +165,21 @@ class IpBgpReport:
     # Class level constants
     PATH_TEMPLATES = {
         'bgp_instance': '/network-instance[name={network_instance}]/protocols/bgp',
+        'bgp_neighbor': '/network-instance[name={network_instance}]/protocols/bgp/neighbor[peer-address=*]',
+        'bgp_neighbor_afi_safi': '/network-instance[name={network_instance}]/protocols/bgp/neighbor[peer-address=*]/afi-safi[afi-safi-name=*]',
+        'attr_set': '/network-instance[name={vrf}]/bgp-rib/attr-sets/attr-set[index={atr}]',
+    }
+
+    # attr-sets resolved one by one before the wildcard prefetch runs, so the
+    # first rows print without waiting for the whole attr-set table
+    ATTR_SET_PREFETCH_AFTER = 32
+
+    # Route leaf used to group 'count' output
+    ROUTE_COUNT_GROUPS = {
+        'none': None,
+        'neighbor': 'neighbor',
+        'rd': 'route_distinguisher',
+        'esi': 'esi'
     }
 
     BGP_STATE_MAP = {
@@ -20,7 +191,7 @@ class IpBgpReport:
         'established': 'Estab'
     }
 
-    def __init__(self):
+    def __init__(self, prefetch_attr_sets=True):
         self._rd = '*'
         self._esi = '*'
         self._mac_address = '*'
@@ -30,6 +201,12 @@ class IpBgpReport:
         self._ethernet_tag = '*'
         self._neighbor = '*'
         self._attrSets_dict = {}
+        # When enabled, all attr-sets of a network-instance are fetched with a
+        # single wildcard query instead of one query per attr_id
+        self._prefetch_attr_sets = prefetch_attr_sets
+        self._attr_sets_loaded = set()
+        # Per network-instance count of attr-sets fetched individually
+        self._attr_set_misses = {}
 
 
     def show_bgp_summary(self, state, output, network_instance='default'):
@@ -46,7 +223,8 @@ class IpBgpReport:
                 
             # Print header and neighbor data
             self._print_bgp_header(bgp_data, network_instance)
-            neighbors = self._get_neighbor_data(bgp_data)
+            neighbor_data, afi_safi_data = self._get_bgp_neighbor_data(state, network_instance)
+            neighbors = self._get_neighbor_data(neighbor_data, afi_safi_data)
             
             if neighbors:
                 self._print_neighbor_table(neighbors)
@@ -58,245 +236,135 @@ class IpBgpReport:
             # Silent error handling - don't print errors
             pass
 
-    def show_evpn_rt1(self, state, output, network_instance='default', esi_value='*'):
-        """Main function to display EVPN RT1 summary"""
+    def show_attr_set_cache(self, state, output):
+        """Display the shared attr-set cache counters"""
+        stats = ATTR_SET_CACHE.stats()
+        print("EVPN attr-set cache")
+        print(f"  Entries        {stats['entries']}/{stats['max_entries']}")
+        print(f"  TTL (seconds)  {stats['ttl']}")
+        print(f"  Hits           {stats['hits']}")
+        print(f"  Misses         {stats['misses']}")
+        print(f"  Evictions      {stats['evictions']}")
+        print(f"  Hit rate       {stats['hit_rate']:.1f}%")
+
+    def show_evpn_route_type(self, state, output, rt_type, network_instance='default', filters=None,
+                             offset=0, limit=None):
+        """Main function to display the routes of one EVPN route type"""
         # Get BGP instance data
         try:
             bgp_data = self._get_bgp_data(state, network_instance)
             # Silently exit if no data found (don't print error messages)
             if not bgp_data:
                 return
-                
-            if not self._has_bgp_config(bgp_data):
-                return
-                
-            # Print header and neighbor data
-            self._print_bgp_rt_header(bgp_data, network_instance)
-            rt1_data = self._getRibRoute1(state, network_instance, esi_value)
-            rt1_routes = self._get_rt1_data(state, network_instance, rt1_data)
-            if rt1_routes:
-                self._print_rt_table(rt1_routes)
-            else:
-                # No neighbors - exit silently
-                pass
-                
-        except Exception as e:
-            # Silent error handling - don't print errors
-            pass
 
-    def show_evpn_rt2(self, state, output, network_instance='default', mac_value='*'):
-        """Main function to display EVPN RT2 summary"""
-        # Get BGP instance data
-        try:
-            bgp_data = self._get_bgp_data(state, network_instance)
-            # Silently exit if no data found (don't print error messages)
-            if not bgp_data:
-                return
-                
             if not self._has_bgp_config(bgp_data):
                 return
-                
-            # Print header and neighbor data
+
+            # Small pages never reach the prefetch threshold, fetch their attr-sets individually
+            filters = filters or {}
+            if limit is not None and limit <= self.ATTR_SET_PREFETCH_AFTER:
+                self._prefetch_attr_sets = False
+
+            # Print header and route data
             self._print_bgp_rt_header(bgp_data, network_instance)
-            rt2_data = self._getRibRoute2(state, network_instance, mac_value)
-            rt2_routes = self._get_rt2_data(state, network_instance, rt2_data)
-            if rt2_routes:
-                self._print_rt_table(rt2_routes)
-            else:
-                # No neighbors - exit silently
-                pass
-                
+            rt_data = self._getRibRoute(state, network_instance, rt_type, filters)
+            rt_routes = self._get_rt_data(state, rt_data, rt_type, offset=offset, limit=limit)
+            self._print_rt_table(rt_routes)
+
         except Exception as e:
             # Silent error handling - don't print errors
             pass
 
-    def show_evpn_rt3(self, state, output, network_instance='default', originr_value='*'):
-        """Main function to display EVPN RT3 summary"""
-        # Get BGP instance data
+    def show_evpn_route_count(self, state, output, rt_type, network_instance='default', filters=None, group_by='none'):
+        """Main function to count the routes of one EVPN route type"""
         try:
-            bgp_data = self._get_bgp_data(state, network_instance)
-            # Silently exit if no data found (don't print error messages)
-            if not bgp_data:
-                return
-                
-            if not self._has_bgp_config(bgp_data):
-                return
-                
-            # Print header and neighbor data
-            self._print_bgp_rt_header(bgp_data, network_instance)
-            rt3_data = self._getRibRoute3(state, network_instance, originr_value)
-            rt3_routes = self._get_rt3_data(state, network_instance, rt3_data)
-            if rt3_routes:
-                self._print_rt_table(rt3_routes)
-            else:
-                # No neighbors - exit silently
-                pass
-                
+            route_type = EVPN_ROUTE_TYPES[rt_type]
+            group_attr = self.ROUTE_COUNT_GROUPS.get(group_by)
+            rt_data = self._getRibRoute(state, network_instance, rt_type, filters or {}, recursive=False)
+            counters = {}
+            for _, route in self._iter_routes(state, rt_data, rt_type):
+                group = str(getattr(route, group_attr, None) or '-') if group_attr else 'Total'
+                counts = counters.get(group)
+                if counts is None:
+                    counts = counters[group] = [0, 0, 0]
+                counts[0] += 1
+                if route.valid_route:
+                    counts[1] += 1
+                if route.best_route:
+                    counts[2] += 1
+            self._print_route_count(route_type['name'], network_instance, group_by, counters)
+
         except Exception as e:
             # Silent error handling - don't print errors
             pass
 
-    def show_evpn_rt4(self, state, output, network_instance='default', esi4_value='*'):
-        """Main function to display EVPN RT4 summary"""
-        # Get BGP instance data
+    def show_evpn_host(self, state, output, address, network_instance='default'):
+        """Main function to display every mac-ip route advertising a MAC, IP or ESI"""
+        key_type, key = self._parse_host_address(address)
         try:
-            bgp_data = self._get_bgp_data(state, network_instance)
-            # Silently exit if no data found (don't print error messages)
-            if not bgp_data:
-                return
-                
-            if not self._has_bgp_config(bgp_data):
-                return
-                
-            # Print header and neighbor data
-            self._print_bgp_rt_header(bgp_data, network_instance)
-            rt4_data = self._getRibRoute4(state, network_instance, esi4_value)
-            rt4_routes = self._get_rt4_data(state, network_instance, rt4_data)
-            if rt4_routes:
-                self._print_rt_table(rt4_routes)
-            else:
-                # No neighbors - exit silently
-                pass
-                
+            index = HOST_INDEX.get(network_instance)
+            if index is None:
+                index = HOST_INDEX.build(network_instance, self._get_host_entries(state, network_instance))
+            self._print_host_table(address, network_instance, index, index[key_type].get(key, []))
+
         except Exception as e:
             # Silent error handling - don't print errors
             pass
 
-    def show_evpn_rt5(self, state, output, network_instance='default', ip_value='*'):
-        """Main function to display EVPN RT5 summary"""
-        # Get BGP instance data
+    def show_evpn_all(self, state, output, network_instance='default'):
+        """Main function to display all EVPN route types from a single RIB fetch"""
         try:
             bgp_data = self._get_bgp_data(state, network_instance)
             # Silently exit if no data found (don't print error messages)
             if not bgp_data:
                 return
-                
+
             if not self._has_bgp_config(bgp_data):
                 return
-                
-            # Print header and neighbor data
+
             self._print_bgp_rt_header(bgp_data, network_instance)
-            rt5_data = self._getRibRoute5(state, network_instance, ip_value)
-            rt5_routes = self._get_rt5_data(state, network_instance, rt5_data)
-            if rt5_routes:
-                self._print_rt_table(rt5_routes)
-            else:
-                # No neighbors - exit silently
-                pass
-                
+            rib_data = self._getRibInPost(state, network_instance)
+            self._print_rt_table(self._get_all_rt_data(state, rib_data))
+
         except Exception as e:
             # Silent error handling - don't print errors
             pass
 
-
     def _get_bgp_data(self, state, network_instance):
-        """Get BGP instance data"""
+        """Get BGP instance leaves (router-id, autonomous-system) without its lists"""
         try:
             path = build_path(self.PATH_TEMPLATES['bgp_instance'].format(
                 network_instance=network_instance
             ))
-            return state.server_data_store.get_data(path, recursive=True)
+            return state.server_data_store.get_data(path, recursive=False)
         except Exception:
             # Silently handle error
             return None
 
-    def _getRibRoute1(self, state, netinst,esi_value):
-        if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-            path_1 = build_path('/network-instance[name={name}]/bgp-rib/afi-safi[afi-safi-name=evpn]/evpn/rib-in-out/rib-in-post/ethernet-ad-route[route-distinguisher={rd}][esi={esi}][ethernet-tag-id={etag}][neighbor={neigh}]',
-                    name = netinst,
-                    rd='*',
-                    esi= esi_value,
-                    etag='*',
-                    neigh='*',
-                    #pathid='*'
-                )
-        else:
-            path_1 = build_path('/network-instance[name={name}]/bgp-rib/evpn/rib-in-out/rib-in-post/ethernet-ad-routes[route-distinguisher={rd}][esi={esi}][ethernet-tag-id={etag}][neighbor={neigh}]',
-                    name = netinst,
-                    rd='*',
-                    esi = esi_value,
-                    etag='*',
-                    neigh='*'
-                )
-        return state.server_data_store.get_data(path_1, recursive=True)
-
-    def _getRibRoute2(self, state, netinst, mac_value):
-        if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-            path_2 = build_path('/network-instance[name={name}]/bgp-rib/afi-safi[afi-safi-name=evpn]/evpn/rib-in-out/rib-in-post/mac-ip-route[route-distinguisher={rd}][mac-length=*][mac-address={mac}][ip-address={ip}][ethernet-tag-id={etag}][neighbor={neigh}]',
-                name = netinst,
-                rd='*',
-                mac = mac_value,
-                ip='*',
-                etag='*',
-                neigh='*'
-            )
-        else:
-            path_2 = build_path('/network-instance[name={name}]/bgp-rib/evpn/rib-in-out/rib-in-post/mac-ip-routes[route-distinguisher={rd}][mac-length=*][mac-address={mac}][ip-address={ip}][ethernet-tag-id={etag}][neighbor={neigh}]',
-                    name = netinst,
-                    rd='*',
-                    mac = mac_value,
-                    ip='*',
-                    etag='*',
-                    neigh='*'
-                )
-        return state.server_data_store.get_data(path_2, recursive=True)
-
-    def _getRibRoute3(self, state, netinst, originr_value):
-        if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-            path_3 = build_path('/network-instance[name={name}]/bgp-rib/afi-safi[afi-safi-name=evpn]/evpn/rib-in-out/rib-in-post/imet-route[route-distinguisher={rd}][originating-router={orouter}][ethernet-tag-id={etag}][neighbor={neigh}]',
-                name = netinst,
-                rd='*',
-                orouter = originr_value,
-                etag='*',
-                neigh='*'
-            )
-        else:
-            path_3 = build_path('/network-instance[name={name}]/bgp-rib/evpn/rib-in-out/rib-in-post/imet-routes[route-distinguisher={rd}][originating-router={orouter}][ethernet-tag-id={etag}][neighbor={neigh}]',
-                    name = netinst,
-                    rd='*',
-                    orouter = originr_value,
-                    etag='*',
-                    neigh='*'
-                )
-        return state.server_data_store.get_data(path_3, recursive=True)
-
-    def _getRibRoute4(self, state, netinst, esi4_value):
-        if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-            path_4 = build_path('/network-instance[name={name}]/bgp-rib/afi-safi[afi-safi-name=evpn]/evpn/rib-in-out/rib-in-post/ethernet-segment-route[route-distinguisher={rd}][esi={esi}][originating-router={orouter}][neighbor={neigh}]',
-                name = netinst,
-                rd='*',
-                esi = esi4_value,
-                orouter='*',
-                neigh='*'
-            )
-        else:
-            path_4 = build_path('/network-instance[name={name}]/bgp-rib/evpn/rib-in-out/rib-in-post/ethernet-segment-routes[route-distinguisher={rd}][esi={esi}][originating-router={orouter}][neighbor={neigh}]',
-                    name = netinst,
-                    rd='*',
-                    esi = esi4_value,
-                    orouter='*',
-                    neigh='*'
-                )
-        return state.server_data_store.get_data(path_4, recursive=True)
-
-    def _getRibRoute5(self, state, netinst, ip_value):
-        if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-            path_5 = build_path('/network-instance[name={name}]/bgp-rib/afi-safi[afi-safi-name=evpn]/evpn/rib-in-out/rib-in-post/ip-prefix-route[route-distinguisher={rd}][ethernet-tag-id={etag}][ip-prefix-length=*][ip-prefix={prefix}][neighbor={neigh}]',
-                name = netinst,
-                rd='*',
-                etag='*',
-                prefix = ip_value,
-                neigh='*'
-            )
-        else:
-            path_5 = build_path('/network-instance[name={name}]/bgp-rib/evpn/rib-in-out/rib-in-post/ip-prefix-routes[route-distinguisher={rd}][ethernet-tag-id={etag}][ip-prefix-length=*][ip-prefix={prefix}][neighbor={neigh}]',
-                name = netinst,
-                rd='*',
-                etag='*',
-                prefix = ip_value,
-                neigh='*'
-                )
-        return state.server_data_store.get_data(path_5, recursive=True)
+    def _get_bgp_neighbor_data(self, state, network_instance):
+        """Get only the neighbor and afi-safi leaves rendered by the summary"""
+        # Neighbor leaves plus the received/sent-messages containers
+        neighbor_path = build_path(self.PATH_TEMPLATES['bgp_neighbor'].format(
+            network_instance=network_instance
+        ))
+        neighbor_data = state.server_data_store.get_data(neighbor_path, recursive=False, include_container_children=True)
+        # Per afi-safi admin-state and received/active routes
+        afi_safi_path = build_path(self.PATH_TEMPLATES['bgp_neighbor_afi_safi'].format(
+            network_instance=network_instance
+        ))
+        afi_safi_data = state.server_data_store.get_data(afi_safi_path, recursive=False)
+        return neighbor_data, afi_safi_data
+
+    def _getRibRoute(self, state, netinst, rt_type, filters, recursive=True):
+        """Fetch one rib-in-post route list, filters are keyed by the list key names"""
+        route_type = EVPN_ROUTE_TYPES[rt_type]
+        keys = {key.replace('-', '_'): filters.get(key, '*') for key in route_type['keys']}
+        path = build_path(route_type['path'][evpn_afi_safi_list(state)], name=netinst, **keys)
+        return state.server_data_store.stream_data(path, recursive=recursive)
+
+    def _getRibInPost(self, state, netinst):
+        path = build_path(RIB_IN_POST_PATHS[evpn_afi_safi_list(state)], name=netinst)
+        return state.server_data_store.stream_data(path, recursive=True)
 
     def _has_bgp_config(self, bgp_data):
         """Check if BGP is configured"""
@@ -363,21 +431,26 @@ class IpBgpReport:
         # Print column headers
         print("         Network             Next Hop         Metric  LocPref Weight Path")
 
-    def _get_neighbor_data(self, bgp_data):
+    def _get_neighbor_data(self, neighbor_data, afi_safi_data):
         """Get BGP neighbor data"""
         neighbors = []
         
         try:
-            bgp = bgp_data.network_instance.get().protocols.get().bgp.get()
+            bgp = neighbor_data.network_instance.get().protocols.get().bgp.get()
             if not hasattr(bgp, 'neighbor'):
                 return neighbors
+
+            # Join the separately fetched afi-safi entries by peer address
+            afi_safis_by_peer = {}
+            for afi_neighbor in afi_safi_data.network_instance.get().protocols.get().bgp.get().neighbor.items():
+                afi_safis_by_peer[afi_neighbor.peer_address] = list(afi_neighbor.afi_safi.items())
                 
             for neighbor in bgp.neighbor.items():
                 if not neighbor:
                     continue
                 # Only check for EVPN neighbors
-                if hasattr(neighbor, 'afi_safi'):
-                    for afi_safi in neighbor.afi_safi.items():
+                if neighbor.peer_address in afi_safis_by_peer:
+                    for afi_safi in afi_safis_by_peer[neighbor.peer_address]:
                         if not afi_safi:
                             continue   
                         if afi_safi.afi_safi_name == 'evpn' and afi_safi.admin_state == 'enable':
@@ -440,121 +513,88 @@ class IpBgpReport:
             
         return neighbors
 
-    def _get_rt1_data(self, state, network_instance, rt1_data):
-        """Get EVPN RT1 data"""
-        rt1_dataset = []
-        for netinst in rt1_data.network_instance.items():
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                evpn_routes = netinst.bgp_rib.get().afi_safi.get().evpn.get().rib_in_out.get()
-            else:
-                evpn_routes = netinst.bgp_rib.get().evpn.get().rib_in_out.get()
-
-            evpn_rib_in_post = evpn_routes.rib_in_post.get()
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                rttable = evpn_rib_in_post.ethernet_ad_route
-            else:
-                rttable = evpn_rib_in_post.ethernet_ad_routes
-            rt_type = '1'
-            for route in rttable.items():
-                status = self._set_status_code(route)
-                route_network = 'RD: ' + route.route_distinguisher + ' auto-discovery ' + str(route.ethernet_tag_id) + ' ' + route.esi
-                route_entry = self._create_route_entry(route_network, status)
-                self._populate_route_attrs(state, route_entry, netinst.name, route.attr_id, rt_type)
-                rt1_dataset.append(route_entry)         
-        return rt1_dataset
-
-    def _get_rt2_data(self, state, network_instance, rt2_data):
-        """Get EVPN RT2 data"""
-        rt2_dataset = []
-        for netinst in rt2_data.network_instance.items():
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                evpn_routes = netinst.bgp_rib.get().afi_safi.get().evpn.get().rib_in_out.get()
-            else:
-                evpn_routes = netinst.bgp_rib.get().evpn.get().rib_in_out.get()
-
-            evpn_rib_in_post = evpn_routes.rib_in_post.get()
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                rttable = evpn_rib_in_post.mac_ip_route
-            else:
-                rttable = evpn_rib_in_post.mac_ip_route
-            rt_type = '2'
-            for route in rttable.items():
-                status = self._set_status_code(route)
-                route_network = 'RD: ' + route.route_distinguisher + ' mac-ip ' + route.mac_address + ' ' + route.ip_address
-                route_entry = self._create_route_entry(route_network, status)
-                self._populate_route_attrs(state, route_entry, netinst.name, route.attr_id, rt_type)
-                rt2_dataset.append(route_entry)         
-        return rt2_dataset
-
-    def _get_rt3_data(self, state, network_instance, rt3_data):
-        """Get EVPN RT3 data"""
-        rt3_dataset = []
-        for netinst in rt3_data.network_instance.items():
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                evpn_routes = netinst.bgp_rib.get().afi_safi.get().evpn.get().rib_in_out.get()
-            else:
-                evpn_routes = netinst.bgp_rib.get().evpn.get().rib_in_out.get()
-
-            evpn_rib_in_post = evpn_routes.rib_in_post.get()
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                rttable = evpn_rib_in_post.imet_route
-            else:
-                rttable = evpn_rib_in_post.imet_route
-            rt_type = '3'
-            for route in rttable.items():
-                status = self._set_status_code(route)
-                route_network = 'RD: ' + route.route_distinguisher + ' imet ' + route.originating_router
-                route_entry = self._create_route_entry(route_network, status)
-                self._populate_route_attrs(state, route_entry, netinst.name, route.attr_id, rt_type)
-                rt3_dataset.append(route_entry)         
-        return rt3_dataset
-
-    def _get_rt4_data(self, state, network_instance, rt4_data):
-        """Get EVPN RT4 data"""
-        rt4_dataset = []
-        for netinst in rt4_data.network_instance.items():
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                evpn_routes = netinst.bgp_rib.get().afi_safi.get().evpn.get().rib_in_out.get()
-            else:
-                evpn_routes = netinst.bgp_rib.get().evpn.get().rib_in_out.get()
-
-            evpn_rib_in_post = evpn_routes.rib_in_post.get()
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                rttable = evpn_rib_in_post.ethernet_segment_route
-            else:
-                rttable = evpn_rib_in_post.ethernet_segment_route
-            rt_type = '4'
-            for route in rttable.items():
-                status = self._set_status_code(route)
-                route_network = 'RD: ' + route.route_distinguisher + ' ethernet-segment ' + route.esi
-                route_entry = self._create_route_entry(route_network, status)
-                self._populate_route_attrs(state, route_entry, netinst.name, route.attr_id, rt_type)
-                rt4_dataset.append(route_entry)         
-        return rt4_dataset
-
-    def _get_rt5_data(self, state, network_instance, rt5_data):
-        """Get EVPN RT5 data"""
-        rt5_dataset = []
-        for netinst in rt5_data.network_instance.items():
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                evpn_routes = netinst.bgp_rib.get().afi_safi.get().evpn.get().rib_in_out.get()
-            else:
-                evpn_routes = netinst.bgp_rib.get().evpn.get().rib_in_out.get()
+    def _get_rt_data(self, state, rib_data, rt_type, offset=0, limit=None):
+        """Yield route entries of a single EVPN route type"""
+        routes = self._iter_routes(state, rib_data, rt_type)
+        if offset or limit is not None:
+            # Stop pulling routes from the stream once the page is complete
+            stop = offset + limit if limit is not None else None
+            routes = itertools.islice(routes, offset, stop)
+        return self._decode_routes(state, routes, rt_type)
+
+    def _get_all_rt_data(self, state, rib_data):
+        """Yield route entries of every EVPN route type from a single rib-in-post fetch"""
+        for netinst in rib_data.network_instance.items():
+            evpn_rib_in_post = self._get_evpn_rib_in_post(state, netinst)
+            for rt_type in EVPN_ROUTE_TYPES:
+                routes = self._iter_rib_in_post_routes(state, netinst.name, evpn_rib_in_post, rt_type)
+                yield from self._decode_routes(state, routes, rt_type)
+
+    def _iter_routes(self, state, rib_data, rt_type):
+        """Yield (network-instance name, route) pairs of one route type"""
+        for netinst in rib_data.network_instance.items():
+            evpn_rib_in_post = self._get_evpn_rib_in_post(state, netinst)
+            yield from self._iter_rib_in_post_routes(state, netinst.name, evpn_rib_in_post, rt_type)
+
+    def _iter_rib_in_post_routes(self, state, netinst_name, evpn_rib_in_post, rt_type):
+        rttable = getattr(evpn_rib_in_post, EVPN_ROUTE_TYPES[rt_type]['list'][evpn_afi_safi_list(state)])
+        for route in rttable.items():
+            yield netinst_name, route
+
+    def _get_host_entries(self, state, network_instance):
+        """Yield a host entry per mac-ip route from a single RT2 fetch"""
+        rt_data = self._getRibRoute(state, network_instance, '2', {})
+        for netinst_name, route in self._iter_routes(state, rt_data, '2'):
+            attrs = self._get_route_attrs(state, netinst_name, route.attr_id) or {}
+            esi = (getattr(route, 'esi', None) or '').upper()
+            ip = route.ip_address
+            yield {
+                'rd': route.route_distinguisher,
+                'mac': route.mac_address.upper(),
+                'ip': self._normalize_ip(ip) if ip and ip not in NULL_IPS else '',
+                'esi': esi if esi != NULL_ESI else '',
+                'neighbor': route.neighbor,
+                'next_hop': attrs.get('nexthop_info', ''),
+                'status': self._set_status_code(route)
+            }
+
+    def _parse_host_address(self, address):
+        """Return the index ('mac', 'ip' or 'esi') and normalized key for a host address"""
+        value = address.strip()
+        octets = value.split(':')
+        if all(len(octet) == 2 for octet in octets):
+            if len(octets) == 6:
+                return 'mac', value.upper()
+            if len(octets) == 10:
+                return 'esi', value.upper()
+        try:
+            return 'ip', str(ipaddress.ip_address(value))
+        except ValueError:
+            raise ValueError(f"'{address}' is not a MAC address, IP address or ESI")
 
-            evpn_rib_in_post = evpn_routes.rib_in_post.get()
-            if state.system_features.bgp_rib_afi_safi_list_for_evpn:
-                rttable = evpn_rib_in_post.ip_prefix_route
-            else:
-                rttable = evpn_rib_in_post.ip_prefix_route
-            rt_type = '5'
-            for route in rttable.items():
-                status = self._set_status_code(route)
-                route_network = 'RD: ' + route.route_distinguisher + ' ip-prefix ' + route.ip_prefix
-                route_entry = self._create_route_entry(route_network, status)
-                self._populate_route_attrs(state, route_entry, netinst.name, route.attr_id, rt_type)
-                rt5_dataset.append(route_entry)         
-        return rt5_dataset
+    def _normalize_ip(self, ip):
+        try:
+            return str(ipaddress.ip_address(ip))
+        except ValueError:
+            return ip
 
+    def _get_evpn_rib_in_post(self, state, netinst):
+        if evpn_afi_safi_list(state):
+            evpn_routes = netinst.bgp_rib.get().afi_safi.get().evpn.get().rib_in_out.get()
+        else:
+            evpn_routes = netinst.bgp_rib.get().evpn.get().rib_in_out.get()
+        return evpn_routes.rib_in_post.get()
+
+    def _decode_routes(self, state, routes, rt_type):
+        """Shared decoder turning (network-instance name, route) pairs into route entries"""
+        route_network = EVPN_ROUTE_TYPES[rt_type]['network']
+        set_status_code = self._set_status_code
+        create_route_entry = self._create_route_entry
+        populate_route_attrs = self._populate_route_attrs
+        for netinst_name, route in routes:
+            route_entry = create_route_entry(route_network(route), set_status_code(route))
+            populate_route_attrs(state, route_entry, netinst_name, route.attr_id, rt_type)
+            yield route_entry
 
     def _create_route_entry(self, route_network, status):
         """Create basic route entry with standard fields"""
@@ -569,28 +609,66 @@ class IpBgpReport:
         }
 
     def _populate_route_attrs(self, state, route_entry, netinst_name, attr_id, route_type='*'):
-        if not attr_id in self._attrSets_dict:
-            path_attr = build_path('/network-instance[name={vrf}]/bgp-rib/attr-sets/attr-set[index={atr}]',
-                              vrf=netinst_name, atr=str(attr_id))
-            attrSets = state.server_data_store.get_data(path_attr, recursive=True, include_container_children=True)
-            self._attrSets_dict[attr_id] = attrSets
-        else:
-            attrSets = self._attrSets_dict[attr_id]
-        for attr in attrSets.get_descendants('/network-instance/bgp-rib/attr-sets/attr-set'):
-            route_entry['nexthop_info'] = attr.next_hop
-            route_entry['locpref_info'] = attr.local_pref
-            as_path = attr.as_path.get().segment.get().member
-            if attr.origin == 'igp':
-                route_entry['path_info'] = ' '.join(map(str,as_path)) + ' i'
-            elif attr.origin == 'egp':
-                route_entry['path_info'] = ' '.join(map(str,as_path)) + ' e'
-            elif attr.origin == 'incomplete':
-                route_entry['path_info'] = '?'
-            if hasattr(attr, 'med') and attr.med:
-                route_entry['metric_info'] = attr.med
+        attrs = self._get_route_attrs(state, netinst_name, attr_id)
+        if attrs:
+            route_entry.update(attrs)
+
+    def _get_route_attrs(self, state, netinst_name, attr_id):
+        """Get the decoded attr-set fields for an attr_id"""
+        key = (netinst_name, attr_id)
+        if key in self._attrSets_dict:
+            return self._attrSets_dict[key]
+        attrs = ATTR_SET_CACHE.get(netinst_name, attr_id)
+        if attrs is not None:
+            self._attrSets_dict[key] = attrs
+            return attrs
+        if self._prefetch_attr_sets and netinst_name not in self._attr_sets_loaded:
+            misses = self._attr_set_misses.get(netinst_name, 0)
+            if misses >= self.ATTR_SET_PREFETCH_AFTER:
+                self._load_attr_sets(state, netinst_name)
+                if key in self._attrSets_dict:
+                    return self._attrSets_dict[key]
             else:
-                route_entry['metric_info'] = '-'
-            route_entry['weight_info'] = '0'
+                self._attr_set_misses[netinst_name] = misses + 1
+        path_attr = build_path(self.PATH_TEMPLATES['attr_set'], vrf=netinst_name, atr=str(attr_id))
+        attrSets = state.server_data_store.get_data(path_attr, recursive=True, include_container_children=True)
+        attrs = None
+        for attr in attrSets.get_descendants('/network-instance/bgp-rib/attr-sets/attr-set'):
+            attrs = self._decode_attr_set(attr)
+        self._attrSets_dict[key] = attrs
+        if attrs is not None:
+            ATTR_SET_CACHE.put(netinst_name, attr_id, attrs)
+        return attrs
+
+    def _load_attr_sets(self, state, netinst_name):
+        """Fetch all attr-sets of a network-instance in one query and index them by attr_id"""
+        self._attr_sets_loaded.add(netinst_name)
+        path_attr = build_path(self.PATH_TEMPLATES['attr_set'], vrf=netinst_name, atr='*')
+        attrSets = state.server_data_store.get_data(path_attr, recursive=True, include_container_children=True)
+        for attr in attrSets.get_descendants('/network-instance/bgp-rib/attr-sets/attr-set'):
+            attrs = self._decode_attr_set(attr)
+            self._attrSets_dict[(netinst_name, attr.index)] = attrs
+            ATTR_SET_CACHE.put(netinst_name, attr.index, attrs)
+
+    def _decode_attr_set(self, attr):
+        """Convert an attr-set into the route entry fields it provides"""
+        attrs = {
+            'nexthop_info': attr.next_hop,
+            'locpref_info': attr.local_pref
+        }
+        as_path = attr.as_path.get().segment.get().member
+        if attr.origin == 'igp':
+            attrs['path_info'] = ' '.join(map(str,as_path)) + ' i'
+        elif attr.origin == 'egp':
+            attrs['path_info'] = ' '.join(map(str,as_path)) + ' e'
+        elif attr.origin == 'incomplete':
+            attrs['path_info'] = '?'
+        if hasattr(attr, 'med') and attr.med:
+            attrs['metric_info'] = attr.med
+        else:
+            attrs['metric_info'] = '-'
+        attrs['weight_info'] = '0'
+        return attrs
 
     def _set_status_code(self, route):
         status = ""
@@ -669,10 +747,33 @@ class IpBgpReport:
             # Fall back to "never" if there's any parsing error
             return "never"
 
+    def _print_route_count(self, route_type_name, network_instance, group_by, counters):
+        """Print per group route counters"""
+        print(f"BGP EVPN {route_type_name} route count for VRF {network_instance}")
+        if group_by != 'none':
+            print(f"  {group_by.capitalize():<40} {'Routes':<10} {'Valid':<10} {'Best':<10}")
+            for group in sorted(counters):
+                total, valid, best = counters[group]
+                print(f"  {group:<40} {total:<10} {valid:<10} {best:<10}")
+        total = sum(counts[0] for counts in counters.values())
+        valid = sum(counts[1] for counts in counters.values())
+        best = sum(counts[2] for counts in counters.values())
+        print(f"  Total routes: {total}, valid: {valid}, best: {best}")
+
+    def _print_host_table(self, address, network_instance, index, hosts):
+        """Print the mac-ip routes advertising a host"""
+        age = int(time.monotonic() - index['built'])
+        print(f"EVPN mac-ip routes for host {address} in VRF {network_instance} (index age {age}s)")
+        print(f"  {'Status':<7} {'RD':<22} {'MAC Address':<18} {'IP Address':<40} {'ESI':<30} {'Next Hop':<16} Neighbor")
+        for host in hosts:
+            print(f"  {host['status']:<7} {host['rd']:<22} {host['mac']:<18} {host['ip'] or '-':<40} "
+                  f"{host['esi'] or '-':<30} {host['next_hop']:<16} {host['neighbor']}")
+        print(f"  Total routes: {len(hosts)}")
+
     def _print_rt_table(self, rt_entries):
-        """Print formatted route type table"""
+        """Print formatted route type table, one route at a time as entries arrive"""
         for rt_entry in rt_entries:    
             print(f" {rt_entry['status_info']:<7} {rt_entry['network_info']:<50}\n "
                   f"                            {rt_entry['nexthop_info']:<16} {rt_entry['metric_info']:<7} "
                   f"{rt_entry['locpref_info']:<7} {rt_entry['weight_info']:<6} "
-                  f"{rt_entry['path_info']:<20} ")
\ No newline at end of file
+                  f"{rt_entry['path_info']:<20} ", flush=True)
\ No newline at end of file
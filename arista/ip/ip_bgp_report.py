@@ -9,6 +9,8 @@ class IpBgpReport:
     # Class level constants
     PATH_TEMPLATES = {
         'bgp_instance': '/network-instance[name={network_instance}]/protocols/bgp',
+        'bgp_neighbor': '/network-instance[name={network_instance}]/protocols/bgp/neighbor[peer-address=*]',
+        'bgp_neighbor_afi_safi': '/network-instance[name={network_instance}]/protocols/bgp/neighbor[peer-address=*]/afi-safi[afi-safi-name=*]',
     }
 
     BGP_STATE_MAP = {
@@ -34,7 +36,8 @@ class IpBgpReport:
                 
             # Print header and neighbor data
             self._print_bgp_header(bgp_data, network_instance)
-            neighbors = self._get_neighbor_data(bgp_data)
+            neighbor_data, afi_safi_data = self._get_bgp_neighbor_data(state, network_instance)
+            neighbors = self._get_neighbor_data(neighbor_data, afi_safi_data)
             
             if neighbors:
                 self._print_neighbor_table(neighbors)
@@ -47,16 +50,30 @@ class IpBgpReport:
             pass
 
     def _get_bgp_data(self, state, network_instance):
-        """Get BGP instance data"""
+        """Get BGP instance leaves (router-id, autonomous-system) without its lists"""
         try:
             path = build_path(self.PATH_TEMPLATES['bgp_instance'].format(
                 network_instance=network_instance
             ))
-            return state.server_data_store.get_data(path, recursive=True)
+            return state.server_data_store.get_data(path, recursive=False)
         except Exception:
             # Silently handle error
             return None
 
+    def _get_bgp_neighbor_data(self, state, network_instance):
+        """Get only the neighbor and afi-safi leaves rendered by the summary"""
+        # Neighbor leaves plus the received/sent-messages containers
+        neighbor_path = build_path(self.PATH_TEMPLATES['bgp_neighbor'].format(
+            network_instance=network_instance
+        ))
+        neighbor_data = state.server_data_store.get_data(neighbor_path, recursive=False, include_container_children=True)
+        # Per afi-safi admin-state and received/active routes
+        afi_safi_path = build_path(self.PATH_TEMPLATES['bgp_neighbor_afi_safi'].format(
+            network_instance=network_instance
+        ))
+        afi_safi_data = state.server_data_store.get_data(afi_safi_path, recursive=False)
+        return neighbor_data, afi_safi_data
+
     def _has_bgp_config(self, bgp_data):
         """Check if BGP is configured"""
         if not bgp_data:
@@ -97,21 +114,26 @@ class IpBgpReport:
         # Print column headers
         print("  Neighbor        V    AS     MsgRcvd   MsgSent   InQ    OutQ   Up/Down   State     PfxRcd    PfxAcc")
 
-    def _get_neighbor_data(self, bgp_data):
+    def _get_neighbor_data(self, neighbor_data, afi_safi_data):
         """Get BGP neighbor data"""
         neighbors = []
         
         try:
-            bgp = bgp_data.network_instance.get().protocols.get().bgp.get()
+            bgp = neighbor_data.network_instance.get().protocols.get().bgp.get()
             if not hasattr(bgp, 'neighbor'):
                 return neighbors
+
+            # Join the separately fetched afi-safi entries by peer address
+            afi_safis_by_peer = {}
+            for afi_neighbor in afi_safi_data.network_instance.get().protocols.get().bgp.get().neighbor.items():
+                afi_safis_by_peer[afi_neighbor.peer_address] = list(afi_neighbor.afi_safi.items())
                 
             for neighbor in bgp.neighbor.items():
                 if not neighbor:
                     continue
                 # check for EVPN neighbors
-                if hasattr(neighbor, 'afi_safi'):
-                    for afi_safi in neighbor.afi_safi.items():
+                if neighbor.peer_address in afi_safis_by_peer:
+                    for afi_safi in afi_safis_by_peer[neighbor.peer_address]:
                         if not afi_safi:
                             continue   
                         if afi_safi.afi_safi_name == 'ipv4-unicast' and afi_safi.admin_state == 'enable':
@@ -5,7 +5,7 @@
 # Copyright (c) 2025 Nokia
 ###########################################################################
 
-from srlinux.mgmt.cli import CliPlugin, KeyCompleter
+from srlinux.mgmt.cli import CliPlugin, ExecuteError, KeyCompleter
 from srlinux.syntax import Syntax
 from srlinux.location import build_path
 import sys
@@ -76,6 +76,15 @@ class Plugin(CliPlugin):
         '_bgp_rib'
     )
 
+    # Route type and the route list key matching each command argument
+    ROUTE_TYPE_ARGUMENTS = {
+        'auto-discovery': ('1', {'esi': 'esi', 'rd': 'route-distinguisher', 'neighbor': 'neighbor', 'ethernet-tag': 'ethernet-tag-id'}),
+        'mac-ip': ('2', {'mac-address': 'mac-address', 'rd': 'route-distinguisher', 'neighbor': 'neighbor', 'ethernet-tag': 'ethernet-tag-id'}),
+        'imet': ('3', {'origin-router': 'originating-router', 'rd': 'route-distinguisher', 'neighbor': 'neighbor', 'ethernet-tag': 'ethernet-tag-id'}),
+        'ethernet-segment': ('4', {'esi': 'esi', 'rd': 'route-distinguisher', 'neighbor': 'neighbor'}),
+        'ip-prefix': ('5', {'ip-address': 'ip-prefix', 'rd': 'route-distinguisher', 'neighbor': 'neighbor', 'ethernet-tag': 'ethernet-tag-id'}),
+    }
+
     def load(self, cli, **_kwargs):
         syntax = Syntax('ip', help='display ip protocol information')
         ip = cli.show_mode.add_command(syntax, update_location=True)
@@ -92,38 +101,77 @@ class Plugin(CliPlugin):
         syntax = Syntax('bgp', help='display bgp information')
         bgp = cli.show_mode.add_command(syntax, update_location=True)
         evpn = bgp.add_command(
-            Syntax('evpn', help='show EVPN information'),
-            update_location=True)
+            Syntax('evpn', help='show EVPN information')
+            .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            update_location=True,
+            callback = self._print_evpn_all)
         evpn_summary = evpn.add_command(
             Syntax('summary')
             .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]')),
             callback = self._print_evpn_summary)
+        evpn_attr_cache = evpn.add_command(
+            Syntax('attr-cache', help='show EVPN attr-set cache statistics'),
+            callback = self._print_attr_cache)
+        evpn_host = evpn.add_command(
+            Syntax('host', help='show the mac-ip routes advertising a host')
+            .add_unnamed_argument('address', help = 'MAC address, IPv4 or IPv6 address or ESI')
+            .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback = self._print_host)
         route_type = evpn.add_command(Syntax('route-type', help='specify the EVPN route type'))
         rt_eth_ad = route_type.add_command(
             Syntax('auto-discovery')
             .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]'))
-            .add_named_argument('esi', default='*', help = 'ESI value'),
+            .add_named_argument('esi', default='*', help = 'ESI value')
+            .add_named_argument('rd', default='*', help = 'Route distinguisher')
+            .add_named_argument('neighbor', default='*', help = 'BGP neighbor IPv4 or IPv6 address')
+            .add_named_argument('ethernet-tag', default='*', help = 'Ethernet tag ID')
+            .add_named_argument('limit', default='0', help = 'maximum number of routes to display, 0 for all')
+            .add_named_argument('offset', default='0', help = 'number of routes to skip before displaying'),
             callback = self._print_1)
         rt_mac_ip = route_type.add_command(
             Syntax('mac-ip')
             .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]'))
-            .add_named_argument('mac-address', default='*', help = 'MAC address'),
+            .add_named_argument('mac-address', default='*', help = 'MAC address')
+            .add_named_argument('rd', default='*', help = 'Route distinguisher')
+            .add_named_argument('neighbor', default='*', help = 'BGP neighbor IPv4 or IPv6 address')
+            .add_named_argument('ethernet-tag', default='*', help = 'Ethernet tag ID')
+            .add_named_argument('limit', default='0', help = 'maximum number of routes to display, 0 for all')
+            .add_named_argument('offset', default='0', help = 'number of routes to skip before displaying'),
             callback = self._print_2)
         rt_imet = route_type.add_command(
             Syntax('imet')
             .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]'))
-            .add_named_argument('origin-router', default='*', help = 'Originating router IPv4 or IPv6 address'),
+            .add_named_argument('origin-router', default='*', help = 'Originating router IPv4 or IPv6 address')
+            .add_named_argument('rd', default='*', help = 'Route distinguisher')
+            .add_named_argument('neighbor', default='*', help = 'BGP neighbor IPv4 or IPv6 address')
+            .add_named_argument('ethernet-tag', default='*', help = 'Ethernet tag ID')
+            .add_named_argument('limit', default='0', help = 'maximum number of routes to display, 0 for all')
+            .add_named_argument('offset', default='0', help = 'number of routes to skip before displaying'),
             callback = self._print_3)
         rt_eth_seg = route_type.add_command(
             Syntax('ethernet-segment')
             .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]'))
-            .add_named_argument('esi', default='*', help = 'ESI value'),
+            .add_named_argument('esi', default='*', help = 'ESI value')
+            .add_named_argument('rd', default='*', help = 'Route distinguisher')
+            .add_named_argument('neighbor', default='*', help = 'BGP neighbor IPv4 or IPv6 address')
+            .add_named_argument('limit', default='0', help = 'maximum number of routes to display, 0 for all')
+            .add_named_argument('offset', default='0', help = 'number of routes to skip before displaying'),
             callback = self._print_4)
         rt_ip_prefix = route_type.add_command(
             Syntax('ip-prefix')
             .add_named_argument('vrf', default='default', help = 'network instance name', suggestions=KeyCompleter('/network-instance[name=*]'))
-            .add_named_argument('ip-address', default='*', help = 'IPv4 or IPv6 address prefix'),
+            .add_named_argument('ip-address', default='*', help = 'IPv4 or IPv6 address prefix')
+            .add_named_argument('rd', default='*', help = 'Route distinguisher')
+            .add_named_argument('neighbor', default='*', help = 'BGP neighbor IPv4 or IPv6 address')
+            .add_named_argument('ethernet-tag', default='*', help = 'Ethernet tag ID')
+            .add_named_argument('limit', default='0', help = 'maximum number of routes to display, 0 for all')
+            .add_named_argument('offset', default='0', help = 'number of routes to skip before displaying'),
             callback = self._print_5)
+        for rt_command in (rt_eth_ad, rt_mac_ip, rt_imet, rt_eth_seg, rt_ip_prefix):
+            rt_command.add_command(
+                Syntax('count', help='count routes without displaying them')
+                .add_named_argument('group-by', default='none', choices=['none', 'neighbor', 'rd', 'esi'], help = 'group the counters by neighbor, RD or ESI'),
+                callback = self._print_count)
         
         #### interface and arp : mozaman ####
 
@@ -175,6 +223,28 @@ class Plugin(CliPlugin):
         print("-" * 100)
         print(f'Try SR Linux command: show network-instance {netinst} protocols bgp neighbor')
 
+    def _print_evpn_all(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._arguments = arguments
+        netinst = self._arguments.get('evpn', 'vrf')
+        EvpnBgpReport().show_evpn_all(state, output, network_instance=netinst)
+        print("-" * 100)
+        print(f'Try SR Linux command: show network-instance {netinst} protocols bgp routes evpn route-type summary')
+
+    def _print_host(self, state, arguments, output, **_kwargs):
+        self._arguments = arguments
+        netinst = self._arguments.get('host', 'vrf')
+        address = self._arguments.get('host', 'address')
+        try:
+            EvpnBgpReport().show_evpn_host(state, output, address, network_instance=netinst)
+        except ValueError as e:
+            raise ExecuteError(str(e))
+        print("-" * 100)
+        print(f'Try SR Linux command: show network-instance {netinst} protocols bgp routes evpn route-type 2 detail')
+
+    def _print_attr_cache(self, state, arguments, output, **_kwargs):
+        EvpnBgpReport().show_attr_set_cache(state, output)
 
     def __init__(self):
         self._rd = '*'
@@ -196,49 +266,58 @@ class Plugin(CliPlugin):
         self._received_count = 0
 
     def _print_1(self, state, arguments, output, **_kwargs):
-        self._route_type = '1'
-        self._arguments = arguments
-        netinst = self._arguments.get('auto-discovery', 'vrf')
-        esi_input = self._arguments.get('auto-discovery', 'esi')
-        EvpnBgpReport().show_evpn_rt1(state, output, network_instance=netinst, esi_value=esi_input)
-        print("-" * 100)
-        print('Try SR Linux command: show network-instance default protocols bgp routes evpn route-type 1 summary')
+        self._print_route_type(state, arguments, output, 'auto-discovery')
 
     def _print_2(self, state, arguments, output, **_kwargs):
-        self._route_type = '2'
-        self._arguments = arguments
-        netinst = self._arguments.get('mac-ip', 'vrf')
-        mac_input = self._arguments.get('mac-ip', 'mac-address')
-        EvpnBgpReport().show_evpn_rt2(state, output, network_instance=netinst, mac_value=mac_input)
-        print("-" * 100)
-        print('Try SR Linux command: show network-instance default protocols bgp routes evpn route-type 2 summary')
+        self._print_route_type(state, arguments, output, 'mac-ip')
 
     def _print_3(self, state, arguments, output, **_kwargs):
-        self._route_type = '3'
-        self._arguments = arguments
-        netinst = self._arguments.get('imet', 'vrf')
-        originr_input = self._arguments.get('imet', 'origin-router')
-        EvpnBgpReport().show_evpn_rt3(state, output, network_instance=netinst, originr_value=originr_input)
-        print("-" * 100)
-        print('Try SR Linux command: show network-instance default protocols bgp routes evpn route-type 3 summary')
+        self._print_route_type(state, arguments, output, 'imet')
 
     def _print_4(self, state, arguments, output, **_kwargs):
-        self._route_type = '4'
+        self._print_route_type(state, arguments, output, 'ethernet-segment')
+
+    def _print_5(self, state, arguments, output, **_kwargs):
+        self._print_route_type(state, arguments, output, 'ip-prefix')
+
+    def _print_route_type(self, state, arguments, output, command):
+        if state.is_intermediate_command:
+            return
+        self._route_type, argument_keys = self.ROUTE_TYPE_ARGUMENTS[command]
         self._arguments = arguments
-        netinst = self._arguments.get('ethernet-segment', 'vrf')
-        esi4_input = self._arguments.get('ethernet-segment', 'esi')
-        EvpnBgpReport().show_evpn_rt4(state, output, network_instance=netinst, esi4_value=esi4_input)
+        netinst = self._arguments.get(command, 'vrf')
+        filters = self._get_route_type_filters(command, argument_keys)
+        limit = self._get_count_argument(command, 'limit')
+        offset = self._get_count_argument(command, 'offset')
+        EvpnBgpReport().show_evpn_route_type(state, output, self._route_type, network_instance=netinst, filters=filters,
+                                             offset=offset, limit=limit or None)
         print("-" * 100)
-        print('Try SR Linux command: show network-instance default protocols bgp routes evpn route-type 4 summary')
+        print(f'Try SR Linux command: show network-instance default protocols bgp routes evpn route-type {self._route_type} summary')
 
-    def _print_5(self, state, arguments, output, **_kwargs):
-        self._route_type = '5'
+    def _print_count(self, state, arguments, output, **_kwargs):
         self._arguments = arguments
-        netinst = self._arguments.get('ip-prefix', 'vrf')
-        ip_input = self._arguments.get('ip-prefix', 'ip-address')
-        EvpnBgpReport().show_evpn_rt5(state, output, network_instance=netinst, ip_value=ip_input)
+        command = next(name for name in self.ROUTE_TYPE_ARGUMENTS if self._arguments.has_node(name))
+        self._route_type, argument_keys = self.ROUTE_TYPE_ARGUMENTS[command]
+        netinst = self._arguments.get(command, 'vrf')
+        filters = self._get_route_type_filters(command, argument_keys)
+        group_by = self._arguments.get('count', 'group-by')
+        EvpnBgpReport().show_evpn_route_count(state, output, self._route_type, network_instance=netinst,
+                                              filters=filters, group_by=group_by)
         print("-" * 100)
-        print('Try SR Linux command: show network-instance default protocols bgp routes evpn route-type 5 summary')
+        print(f'Try SR Linux command: show network-instance default protocols bgp routes evpn route-type {self._route_type} summary')
+
+    def _get_route_type_filters(self, command, argument_keys):
+        return {key: self._arguments.get(command, argument) for argument, key in argument_keys.items()}
+
+    def _get_count_argument(self, command, name):
+        value = self._arguments.get(command, name)
+        try:
+            count = int(value)
+        except (TypeError, ValueError):
+            raise ExecuteError(f"Invalid {name} '{value}', expected a non-negative integer")
+        if count < 0:
+            raise ExecuteError(f"Invalid {name} '{value}', expected a non-negative integer")
+        return count
 
 ########## Interface and ARP: mozaman ###########
 
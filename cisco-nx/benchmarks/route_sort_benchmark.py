@@ -0,0 +1,67 @@
+"""
+Benchmark of the route table sort used by 'show ip route'
+Compares sorting with an ipaddress.ip_network object per route against the
+packed integer key (network address << 8 | prefix length) cached on each
+route entry.
+
+Usage: python3 route_sort_benchmark.py [number of routes]
+"""
+import ipaddress
+import operator
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ip'))
+
+from route_prefix import prefix_sort_key
+
+
+def make_routes(count, seed=1):
+    """Build route entries with random, properly masked IPv4 prefixes"""
+    rng = random.Random(seed)
+    routes = []
+    for _ in range(count):
+        length = rng.randint(8, 32)
+        address = rng.getrandbits(32) & ((0xFFFFFFFF << (32 - length)) & 0xFFFFFFFF)
+        routes.append({'prefix': f'{ipaddress.IPv4Address(address)}/{length}'})
+    return routes
+
+
+def sort_with_ip_network(routes):
+    return sorted(routes, key=lambda x: int(ipaddress.ip_network(x['prefix']).network_address))
+
+
+def sort_with_packed_key(routes):
+    for route in routes:
+        route['sort_key'] = prefix_sort_key(route['prefix'])
+    return sorted(routes, key=operator.itemgetter('sort_key'))
+
+
+def timed(function, routes):
+    start = time.perf_counter()
+    result = function(routes)
+    return time.perf_counter() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    routes = make_routes(count)
+
+    ip_network_time, by_ip_network = timed(sort_with_ip_network, [dict(route) for route in routes])
+    packed_key_time, by_packed_key = timed(sort_with_packed_key, [dict(route) for route in routes])
+
+    # Only the order of equal network addresses may differ
+    same_order = all(int(ipaddress.ip_network(a['prefix']).network_address) == int(ipaddress.ip_network(b['prefix']).network_address)
+                     for a, b in zip(by_ip_network, by_packed_key))
+
+    print(f'Routes:                    {count}')
+    print(f'ip_network sort key:       {ip_network_time:.2f}s')
+    print(f'packed integer sort key:   {packed_key_time:.2f}s')
+    print(f'Speedup:                   {ip_network_time / packed_key_time:.1f}x')
+    print(f'Same address order:        {same_order}')
+
+
+if __name__ == '__main__':
+    main()
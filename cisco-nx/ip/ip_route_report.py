@@ -8,8 +8,13 @@ from srlinux.syntax import Syntax
 from srlinux.location import build_path
 from srlinux.mgmt.cli import KeyCompleter
 import datetime
+import heapq
 import ipaddress
+import operator
+import sys
+import time
 from srlinux.schema import FixedSchemaRoot
+from route_prefix import PrefixTrie, parse_prefix, prefix_sort_key
 
 class IpRouteReport:
     """Handles the 'ip route' command functionality."""
@@ -35,27 +40,422 @@ class IpRouteReport:
     }
 
     PATH_TEMPLATES = {
-        'routes': '/network-instance[name={network_instance}]/route-table/ipv4-unicast/route',
+        'routes': '/network-instance[name={network_instance}]/route-table/{afi}/route',
+        'routes_by_type': '/network-instance[name={network_instance}]/route-table/{afi}/route[{prefix_key}=*][route-type={route_type}][route-owner=*]',
         'next_hop_group': '/network-instance[name={network_instance}]/route-table/next-hop-group[index={nhg_id}]',
         'next_hop': '/network-instance[name={network_instance}]/route-table/next-hop[index={nh_id}]',
-        'route_detail': '/network-instance[name={network_instance}]/route-table/ipv4-unicast/route[ipv4-prefix={ip_prefix}][route-type={route_type}][route-owner={route_owner}]'
+        'route_detail': '/network-instance[name={network_instance}]/route-table/{afi}/route[{prefix_key}={ip_prefix}][route-type={route_type}][route-owner={route_owner}]',
+        'route_prefix': '/network-instance[name={network_instance}]/route-table/{afi}/route[{prefix_key}={ip_prefix}][route-type=*][route-owner=*]',
+        'route_keys': '/network-instance[name={network_instance}]/route-table/{afi}/route[{prefix_key}=*][route-type=*][route-owner=*]/{prefix_key}'
     }
 
-    def _show_routes(self, state, output, network_instance):
-        """Main function to display routes"""
+    # Address family -> path element, path key, data attribute, prefix attribute and default route
+    ROUTE_TABLES = {
+        'ipv4': ('ipv4-unicast', 'ipv4-prefix', 'ipv4_unicast', 'ipv4_prefix', '0.0.0.0/0'),
+        'ipv6': ('ipv6-unicast', 'ipv6-prefix', 'ipv6_unicast', 'ipv6_prefix', '::/0'),
+    }
+
+    # Address family names used in section headers
+    AFI_NAMES = {
+        'ipv4': 'IPv4',
+        'ipv6': 'IPv6',
+    }
+
+    # Protocol keyword -> route-type keys selected on the server, any route-owner
+    ROUTE_PROTOCOLS = {
+        'bgp': ('bgp', 'bgp-evpn', 'bgp-vpn', 'bgp-label'),
+        'static': ('static',),
+        'connected': ('local', 'host'),
+        'isis': ('isis',),
+        'ospf': ('ospfv2', 'ospfv3'),
+    }
+
+    # Above this many longer prefixes the table is fetched once instead of per prefix
+    LONGER_PREFIXES_KEYED_LIMIT = 64
+
+    # Longest next-hop -> resolving route chain followed before giving up
+    MAX_RESOLUTION_DEPTH = 8
+
+    def __init__(self, bulk_next_hops=True, debug=False):
+        # When enabled, the next-hop-group and next-hop tables are fetched once
+        # per command and routes are resolved from in-memory indexes
+        self._bulk_next_hops = bulk_next_hops
+        self._next_hop_tables = {}
+        # Resolved next-hop ids of groups fetched one by one
+        self._next_hop_group_cache = {}
+        # Per command resolution caches, each chain is only walked once
+        self._next_hop_info_cache = {}
+        self._resolving_route_cache = {}
+        self._resolving_routes_in_progress = set()
+        # Rendered next-hop line template of each next-hop-group
+        self._next_hop_block_cache = {}
+        self._next_hop_block_hits = 0
+        self._next_hop_block_misses = 0
+        self._debug = debug
+
+    def _show_routes(self, state, output, network_instance, protocol=None, afi='ipv4'):
+        """Main function to display routes, optionally of a single protocol"""
+        start = time.monotonic()
+        self._print_header()
+
+        if network_instance != 'default':
+            print(f'Routing Table: VRF {network_instance}\n')
+
+        self._show_route_table(state, network_instance, afi, protocol)
+        self._print_debug_footer(start)
+
+    def _show_all_afi_routes(self, state, output, network_instance):
+        """Display the IPv4 and IPv6 route tables, resolved from one set of next-hop tables"""
+        start = time.monotonic()
         self._print_header()
 
         if network_instance != 'default':
             print(f'Routing Table: VRF {network_instance}\n')
 
-        # Get all routes
-        routes_data = self._get_routes_data(state, network_instance)
-        if not routes_data:
+        for afi in self.ROUTE_TABLES:
+            print(f'{self.AFI_NAMES[afi]} Routing Table:')
+            self._show_route_table(state, network_instance, afi, empty_message=f'No {self.AFI_NAMES[afi]} routes')
+            print()
+        self._print_debug_footer(start)
+
+    def _show_route_table(self, state, network_instance, afi, protocol=None, empty_message=None):
+        """Fetch, process and display the routes of one address family"""
+        if protocol:
+            # Only the routes of this protocol are serialised by the server
+            routes_data_list = self._get_protocol_routes_data(state, network_instance, protocol, afi)
+        else:
+            routes_data = self._get_routes_data(state, network_instance, afi)
+            routes_data_list = [routes_data] if routes_data else []
+        if not routes_data_list:
+            if empty_message:
+                print(empty_message)
+            else:
+                self._print_not_found_message(network_instance)
+            return
+
+        # Each result is already sorted, merge them into a single table
+        route_entries = list(heapq.merge(
+            *(self._process_routes(state, network_instance, routes_data, afi=afi) for routes_data in routes_data_list),
+            key=operator.itemgetter('sort_key')
+        ))
+        if not route_entries and empty_message:
+            print(empty_message)
+            return
+        self._display_routes(route_entries, network_instance, self.ROUTE_TABLES[afi][4])
+
+    def _stream_routes(self, state, output, network_instance, afi='ipv4'):
+        """Display routes in datastore order as they are received, without buffering the table"""
+        self._print_header()
+
+        if network_instance != 'default':
+            print(f'Routing Table: VRF {network_instance}\n')
+
+        afi_path, prefix_key, table_attr, prefix_attr, default_prefix = self.ROUTE_TABLES[afi]
+        # A keyed probe answers the default route question without reading the table first
+        try:
+            default_path = build_path(self.PATH_TEMPLATES['route_prefix'].format(
+                network_instance=network_instance,
+                afi=afi_path,
+                prefix_key=prefix_key,
+                ip_prefix=default_prefix
+            ))
+            default_data = state.server_data_store.get_data(default_path, recursive=False)
+            default_route_exists = any(True for _ in default_data.get_descendants(f'/network-instance/route-table/{afi_path}/route'))
+        except Exception as e:
+            default_route_exists = False
+        if not default_route_exists:
+            print("Gateway of last resort is not set", flush=True)
+
+        try:
+            routes_path = build_path(self.PATH_TEMPLATES['routes'].format(network_instance=network_instance, afi=afi_path))
+            routes_data = state.server_data_store.stream_data(routes_path, recursive=True)
+            for route in routes_data.get_descendants(f'/network-instance/route-table/{afi_path}/route'):
+                route_entry = self._create_route_entry(route, getattr(route, prefix_attr))
+                if route.route_type in ['local', 'connected']:
+                    self._process_connected_route(state, network_instance, route, route_entry)
+                else:
+                    self._process_regular_route(state, network_instance, route, route_entry)
+                self._display_route(route_entry)
+                sys.stdout.flush()
+        except Exception as e:
+            self._print_not_found_message(network_instance)
+
+    def _watch_routes(self, state, output, network_instance, interval=5, count=0, afi='ipv4'):
+        """Poll the route keys and print only added, removed and changed routes"""
+        previous = self._get_route_snapshot(state, network_instance, afi)
+        if previous is None:
             self._print_not_found_message(network_instance)
             return
 
-        route_entries = self._process_routes(state, network_instance, routes_data)
-        self._display_routes(route_entries, network_instance)
+        # Resolved next hops per next-hop-group. Groups with indirect next hops resolve
+        # through other routes and are re-resolved on every poll, the others never change
+        indirect_groups = self._get_indirect_next_hop_groups(state, network_instance)
+        group_next_hops = {}
+        for next_hop_group in {group for _, group in previous.values()} & indirect_groups:
+            group_next_hops[next_hop_group] = self._resolve_next_hop_group(state, network_instance, next_hop_group)
+        print(f'Watching {len(previous)} {self.AFI_NAMES[afi]} routes in VRF {network_instance} every {interval}s, Ctrl-C to stop', flush=True)
+
+        polls = 0
+        try:
+            while not count or polls < count:
+                time.sleep(interval)
+                polls += 1
+                current = self._get_route_snapshot(state, network_instance, afi)
+                if current is None:
+                    continue
+                self._print_route_changes(state, network_instance, previous, current, group_next_hops, indirect_groups)
+                previous = current
+        except KeyboardInterrupt:
+            pass
+
+    def _get_route_snapshot(self, state, network_instance, afi='ipv4'):
+        """Return a map of (prefix, route-type, route-owner) -> (code, next-hop-group) from the route leaves only"""
+        afi_path, _, _, prefix_attr, _ = self.ROUTE_TABLES[afi]
+        try:
+            routes_path = build_path(self.PATH_TEMPLATES['routes'].format(network_instance=network_instance, afi=afi_path))
+            routes_data = state.server_data_store.stream_data(routes_path, recursive=False)
+            snapshot = {}
+            for route in routes_data.get_descendants(f'/network-instance/route-table/{afi_path}/route'):
+                snapshot[(getattr(route, prefix_attr), route.route_type, route.route_owner)] = (
+                    self._get_route_code(route.route_type, route.route_owner),
+                    getattr(route, 'next_hop_group', None))
+            return snapshot
+        except Exception as e:
+            return None
+
+    def _get_indirect_next_hop_groups(self, state, network_instance):
+        """Return the ids of the next-hop-groups holding an indirect next hop, from one bulk read"""
+        try:
+            tables = self._get_next_hop_tables(state, network_instance)
+            indirect_groups = {next_hop_group for next_hop_group, nh_ids in tables['groups'].items()
+                               if any(getattr(tables['next_hops'].get(nh_id), 'type', '') == 'indirect' for nh_id in nh_ids)}
+        except Exception as e:
+            indirect_groups = set()
+        # Only needed once, polls resolve per group
+        self._next_hop_tables = {}
+        return indirect_groups
+
+    def _resolve_next_hop_group(self, state, network_instance, next_hop_group):
+        """Return the sorted (ip, interface) next hops of a next-hop-group"""
+        if not next_hop_group:
+            return ()
+        return tuple(sorted((nh['ip'], nh['interface'])
+                            for nh in self._get_next_hops(state, network_instance, next_hop_group)))
+
+    def _get_group_next_hops(self, state, network_instance, next_hop_group, group_next_hops, indirect_groups):
+        """Get the resolved next hops of a group, classifying and resolving groups not seen before"""
+        if next_hop_group in group_next_hops:
+            return group_next_hops[next_hop_group]
+        resolved = self._resolve_next_hop_group(state, network_instance, next_hop_group)
+        if next_hop_group and any(getattr(self._get_next_hop(state, network_instance, nh_id), 'type', '') == 'indirect'
+                                  for nh_id in self._get_next_hop_ids(state, network_instance, next_hop_group)):
+            indirect_groups.add(next_hop_group)
+        group_next_hops[next_hop_group] = resolved
+        return resolved
+
+    def _print_route_changes(self, state, network_instance, previous, current, group_next_hops, indirect_groups):
+        """Print the differences between two route snapshots, resolving only added, changed and indirect routes"""
+        # Next-hop and resolving route state may have moved between polls, group members are fixed per id
+        self._next_hop_info_cache = {}
+        self._resolving_route_cache = {}
+
+        # An indirect group keeps its id when its resolving route changes, compare its resolved next hops
+        current_groups = {group for _, group in current.values()}
+        changed_groups = {}
+        for next_hop_group in current_groups & indirect_groups:
+            resolved = self._resolve_next_hop_group(state, network_instance, next_hop_group)
+            old = group_next_hops.get(next_hop_group)
+            if old is not None and old != resolved:
+                changed_groups[next_hop_group] = old
+            group_next_hops[next_hop_group] = resolved
+
+        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
+        changes = []
+        for key, (code, next_hop_group) in current.items():
+            if key in previous:
+                previous_group = previous[key][1]
+                if previous_group == next_hop_group and next_hop_group not in changed_groups:
+                    continue
+                if previous_group == next_hop_group:
+                    old = changed_groups[next_hop_group]
+                else:
+                    old = group_next_hops.get(previous_group)
+            resolved = self._get_group_next_hops(state, network_instance, next_hop_group, group_next_hops, indirect_groups)
+            if key not in previous:
+                changes.append((key, f"{timestamp} added     {code:<4} {key[0]} {self._format_next_hops(resolved)}"))
+            else:
+                detail = self._format_next_hops(old) if old is not None else f'next-hop-group {previous_group}'
+                changes.append((key, f"{timestamp} changed   {code:<4} {key[0]} {detail} -> {self._format_next_hops(resolved)}"))
+        for key, (code, next_hop_group) in previous.items():
+            if key not in current:
+                old = group_next_hops.get(next_hop_group)
+                detail = self._format_next_hops(old) if old is not None else f'next-hop-group {next_hop_group}'
+                changes.append((key, f"{timestamp} removed   {code:<4} {key[0]} {detail}"))
+
+        for _, line in sorted(changes, key=lambda change: prefix_sort_key(change[0][0])):
+            print(line)
+        sys.stdout.flush()
+
+        # Forget groups no route references any more
+        for next_hop_group in [group for group in group_next_hops if group not in current_groups]:
+            del group_next_hops[next_hop_group]
+            self._next_hop_group_cache.pop((network_instance, next_hop_group), None)
+        indirect_groups &= current_groups
+
+    def _format_next_hops(self, next_hops):
+        """Format (ip, interface) next hops on a single line"""
+        if not next_hops:
+            return 'no next-hop'
+        return '; '.join(f"via {ip}, {interface}" if interface else f"via {ip}" for ip, interface in next_hops)
+
+    def _show_route_summary(self, state, output, network_instance):
+        """Display per protocol route and path counters without resolving next hops"""
+        try:
+            nhg_sizes = self._get_next_hop_group_sizes(state, network_instance)
+            routes_path = build_path(self.PATH_TEMPLATES['routes'].format(network_instance=network_instance, afi='ipv4-unicast'))
+            routes_data = state.server_data_store.stream_data(routes_path, recursive=False)
+        except Exception as e:
+            self._print_not_found_message(network_instance)
+            return
+
+        total_routes = 0
+        total_paths = 0
+        # (route-type, route-owner) -> [routes, best paths, paths, ecmp routes]
+        protocols = {}
+        mask_lengths = {}
+        for route in routes_data.get_descendants('/network-instance/route-table/ipv4-unicast/route'):
+            paths = nhg_sizes.get(getattr(route, 'next_hop_group', None), 0) or 1
+            counters = protocols.get((route.route_type, route.route_owner))
+            if counters is None:
+                counters = protocols[(route.route_type, route.route_owner)] = [0, 0, 0, 0]
+            counters[0] += 1
+            if getattr(route, 'active', False):
+                counters[1] += 1
+            counters[2] += paths
+            if paths > 1:
+                counters[3] += 1
+            total_routes += 1
+            total_paths += paths
+            mask_length = route.ipv4_prefix.rpartition('/')[2]
+            mask_lengths[mask_length] = mask_lengths.get(mask_length, 0) + 1
+
+        self._display_route_summary(network_instance, total_routes, total_paths, protocols, mask_lengths)
+
+    def _get_next_hop_group_sizes(self, state, network_instance):
+        """Get the number of resolved next hops of every next-hop-group"""
+        nhg_path = build_path(self.PATH_TEMPLATES['next_hop_group'].format(
+            network_instance=network_instance,
+            nhg_id='*'
+        ))
+        nhg_data = state.server_data_store.get_data(nhg_path, recursive=True)
+        return {nhg.index: len(self._get_resolved_next_hop_ids(nhg))
+                for nhg in nhg_data.get_descendants('/network-instance/route-table/next-hop-group')}
+
+    def _display_route_summary(self, network_instance, total_routes, total_paths, protocols, mask_lengths):
+        """Display route summary counters"""
+        print(f'IP Route Table for VRF "{network_instance}"')
+        print(f'Total number of routes: {total_routes}')
+        print(f'Total number of paths:  {total_paths}\n')
+
+        print(f"{'Protocol':<10} {'Owner':<22} {'Routes':>8} {'Best':>8} {'Paths':>8} {'ECMP':>8}")
+        for (route_type, route_owner), (routes, best, paths, ecmp) in sorted(protocols.items()):
+            print(f"{route_type:<10} {route_owner:<22} {routes:>8} {best:>8} {paths:>8} {ecmp:>8}")
+
+        print('\nNumber of routes per mask-length:')
+        lengths = sorted(mask_lengths, key=int)
+        for i in range(0, len(lengths), 5):
+            print('  ' + '  '.join(f"/{length:<3}: {mask_lengths[length]:<6}" for length in lengths[i:i + 5]))
+
+    def _show_route_lookup(self, state, output, network_instance, address, longer_prefixes=False):
+        """Display the longest match of an address, an exact prefix or its longer prefixes"""
+        network, length, is_prefix = self._parse_lookup_address(address)
+        self._print_header()
+
+        if network_instance != 'default':
+            print(f'Routing Table: VRF {network_instance}\n')
+
+        try:
+            if longer_prefixes:
+                prefixes = list(self._get_prefix_trie(state, network_instance).longer_prefixes(network, length))
+            elif is_prefix:
+                # Exact prefixes go straight into the route key
+                prefixes = [str(ipaddress.ip_network(address, strict=False))]
+            else:
+                prefixes = None
+            if prefixes is None:
+                # Probe keyed routes from /32 down to /0 against the live table
+                route_entries = self._probe_longest_match(state, network_instance, network)
+            else:
+                route_entries = self._get_prefix_routes(state, network_instance, prefixes)
+        except Exception as e:
+            route_entries = []
+
+        if not route_entries:
+            print('Route not found')
+            return
+        for route in route_entries:
+            self._display_route(route)
+
+    def _parse_lookup_address(self, address):
+        """Return (network as int, prefix length, is prefix) of an IPv4 address or prefix"""
+        if '/' in address:
+            network = ipaddress.ip_network(address, strict=False)
+            if network.version != 4:
+                raise ValueError(f"'{address}' is not an IPv4 prefix")
+            return int(network.network_address), network.prefixlen, True
+        ip = ipaddress.ip_address(address)
+        if ip.version != 4:
+            raise ValueError(f"'{address}' is not an IPv4 address")
+        return int(ip), ip.max_prefixlen, False
+
+    def _probe_longest_match(self, state, network_instance, address):
+        """Return the processed routes of the longest prefix covering address, probing one prefix length at a time"""
+        for length in range(32, -1, -1):
+            prefix = str(ipaddress.IPv4Network((address, length), strict=False))
+            try:
+                route_entries = self._get_prefix_routes(state, network_instance, [prefix])
+            except Exception as e:
+                continue
+            if route_entries:
+                return route_entries
+        return []
+
+    def _get_prefix_trie(self, state, network_instance):
+        """Build a prefix trie of the current route table keys"""
+        # Only the prefix key leaf of each route is read
+        routes_path = build_path(self.PATH_TEMPLATES['route_keys'].format(
+            network_instance=network_instance,
+            afi='ipv4-unicast',
+            prefix_key='ipv4-prefix'
+        ))
+        routes_data = state.server_data_store.get_data(routes_path, recursive=False)
+        prefixes = {route.ipv4_prefix for route in routes_data.get_descendants('/network-instance/route-table/ipv4-unicast/route')}
+        trie = PrefixTrie()
+        for prefix in prefixes:
+            prefix_network, prefix_length, _ = parse_prefix(prefix)
+            trie.insert(prefix_network, prefix_length, prefix)
+        return trie
+
+    def _get_prefix_routes(self, state, network_instance, prefixes):
+        """Get the processed routes of the given prefixes"""
+        if not prefixes:
+            return []
+        if len(prefixes) > self.LONGER_PREFIXES_KEYED_LIMIT:
+            wanted = set(prefixes)
+            routes_data = self._get_routes_data(state, network_instance)
+            return self._process_routes(state, network_instance, routes_data, wanted)
+
+        route_entries = []
+        for prefix in prefixes:
+            route_path = build_path(self.PATH_TEMPLATES['route_prefix'].format(
+                network_instance=network_instance,
+                afi='ipv4-unicast',
+                prefix_key='ipv4-prefix',
+                ip_prefix=prefix
+            ))
+            routes_data = state.server_data_store.get_data(route_path, recursive=True)
+            route_entries.extend(self._process_routes(state, network_instance, routes_data))
+        return sorted(route_entries, key=operator.itemgetter('sort_key'))
 
     def _print_header(self):
         """Print command header and legend"""
@@ -63,28 +463,61 @@ class IpRouteReport:
        Ag - aggregate, Ar - arp-nd, BL - bgp-label, BE - bgp-evpn, BV - bgp-vpn
        D - dhcp, G - gribi, H - host, Li - linux, N1/N2 - ndk\n''')
 
+    def _print_debug_footer(self, start):
+        """Print elapsed time and next-hop render cache counters when debugging"""
+        if not self._debug:
+            return
+        lookups = self._next_hop_block_hits + self._next_hop_block_misses
+        hit_rate = 100.0 * self._next_hop_block_hits / lookups if lookups else 0.0
+        print(f'\nElapsed: {time.monotonic() - start:.2f}s')
+        print(f'Next-hop render cache: {self._next_hop_block_hits} hits, {self._next_hop_block_misses} misses, '
+              f'{len(self._next_hop_block_cache)} entries, {hit_rate:.1f}% hit rate')
+
     def _print_not_found_message(self, network_instance):
         """Print error message when VRF/routes not found"""
         print(f"Error: VRF '{network_instance}' not found or no routes present.")
 
-    def _get_routes_data(self, state, network_instance):
+    def _get_routes_data(self, state, network_instance, afi='ipv4'):
         """Get routes with proper error handling"""
         try:
-            routes_path = build_path(self.PATH_TEMPLATES['routes'].format(network_instance=network_instance))
+            routes_path = build_path(self.PATH_TEMPLATES['routes'].format(
+                network_instance=network_instance,
+                afi=self.ROUTE_TABLES[afi][0]
+            ))
             return state.server_data_store.get_data(routes_path, recursive=True)
         except Exception as e:
             return None
 
-    def _process_routes(self, state, network_instance, routes_data):
-        """Process all routes and return sorted entries"""
+    def _get_protocol_routes_data(self, state, network_instance, protocol, afi='ipv4'):
+        """Get the routes of one protocol, keyed by route-type"""
+        routes_data_list = []
+        for route_type in self.ROUTE_PROTOCOLS[protocol]:
+            try:
+                routes_path = build_path(self.PATH_TEMPLATES['routes_by_type'].format(
+                    network_instance=network_instance,
+                    afi=self.ROUTE_TABLES[afi][0],
+                    prefix_key=self.ROUTE_TABLES[afi][1],
+                    route_type=route_type
+                ))
+                routes_data_list.append(state.server_data_store.get_data(routes_path, recursive=True))
+            except Exception as e:
+                pass
+        return routes_data_list
+
+    def _process_routes(self, state, network_instance, routes_data, prefixes=None, afi='ipv4'):
+        """Process all routes (or only the given prefixes) and return sorted entries"""
         all_routes = []
+        table_attr, prefix_attr = self.ROUTE_TABLES[afi][2:4]
         
         for ni in routes_data.network_instance.items():
             route_table = ni.route_table.get()
-            ipv4_unicast = route_table.ipv4_unicast.get()
+            unicast = getattr(route_table, table_attr).get()
 
-            for route in ipv4_unicast.route.items():
-                route_entry = self._create_route_entry(route)
+            for route in unicast.route.items():
+                prefix = getattr(route, prefix_attr)
+                if prefixes is not None and prefix not in prefixes:
+                    continue
+                route_entry = self._create_route_entry(route, prefix)
                 
                 if route.route_type in ['local', 'connected']:
                     self._process_connected_route(state, network_instance, route, route_entry)
@@ -93,16 +526,18 @@ class IpRouteReport:
                 
                 all_routes.append(route_entry)
 
-        return sorted(all_routes, key=lambda x: int(ipaddress.ip_network(x['prefix']).network_address))
+        return sorted(all_routes, key=operator.itemgetter('sort_key'))
 
-    def _create_route_entry(self, route):
+    def _create_route_entry(self, route, prefix):
         """Create basic route entry with standard fields"""
         return {
-            'prefix': route.ipv4_prefix,
+            'prefix': prefix,
+            'sort_key': prefix_sort_key(prefix),
             'code': self._get_route_code(route.route_type, route.route_owner),
             'type': route.route_type,
             'owner': route.route_owner,
             'next_hops': [],
+            'next_hop_group': getattr(route, 'next_hop_group', None),
             'uptime': self._format_uptime(route),
             'interface': None,
             'preference': route.preference,
@@ -131,75 +566,155 @@ class IpRouteReport:
             except Exception as e:
                 pass
 
-    def _get_next_hops(self, state, network_instance, next_hop_group):
+    def _get_next_hops(self, state, network_instance, next_hop_group, depth=0):
         """Get next-hop information for a route"""
         next_hops = []
         try:
-            nhg_path = build_path(self.PATH_TEMPLATES['next_hop_group'].format(
-                network_instance=network_instance, 
-                nhg_id=next_hop_group
-            ))
-            nhg_data = state.server_data_store.get_data(nhg_path, recursive=True)
-
-            for ni in nhg_data.network_instance.items():
-                nhg = ni.route_table.get().next_hop_group.get()
-                for nh in nhg.next_hop.items():
-                    if hasattr(nh, 'next_hop') and getattr(nh, 'resolved', False):
-                        next_hop_info = self._get_next_hop_info(state, network_instance, nh.next_hop)
-                        if next_hop_info:
-                            next_hops.append(next_hop_info)
+            for nh_id in self._get_next_hop_ids(state, network_instance, next_hop_group):
+                next_hop_info = self._get_next_hop_info(state, network_instance, nh_id, depth)
+                if next_hop_info:
+                    next_hops.append(next_hop_info)
         except Exception as e:
             pass
 
         return next_hops
 
-    def _get_next_hop_info(self, state, network_instance, next_hop_id):
-        """Get detailed next-hop information"""
+    def _get_next_hop_ids(self, state, network_instance, next_hop_group):
+        """Get the resolved next-hop ids of a next-hop-group"""
+        if self._bulk_next_hops:
+            groups = self._get_next_hop_tables(state, network_instance)['groups']
+            if next_hop_group in groups:
+                return groups[next_hop_group]
+
+        key = (network_instance, next_hop_group)
+        if key in self._next_hop_group_cache:
+            return self._next_hop_group_cache[key]
+
+        nhg_path = build_path(self.PATH_TEMPLATES['next_hop_group'].format(
+            network_instance=network_instance, 
+            nhg_id=next_hop_group
+        ))
+        nhg_data = state.server_data_store.get_data(nhg_path, recursive=True)
+        nh_ids = []
+        for nhg in nhg_data.get_descendants('/network-instance/route-table/next-hop-group'):
+            nh_ids.extend(self._get_resolved_next_hop_ids(nhg))
+        self._next_hop_group_cache[key] = nh_ids
+        return nh_ids
+
+    def _get_resolved_next_hop_ids(self, nhg):
+        return [nh.next_hop for nh in nhg.next_hop.items()
+                if hasattr(nh, 'next_hop') and getattr(nh, 'resolved', False)]
+
+    def _get_next_hop_tables(self, state, network_instance):
+        """Fetch every next-hop-group and next-hop of the network-instance once and index them by id"""
+        tables = self._next_hop_tables.get(network_instance)
+        if tables is not None:
+            return tables
+
+        tables = {'groups': {}, 'next_hops': {}}
+        self._next_hop_tables[network_instance] = tables
+        nhg_path = build_path(self.PATH_TEMPLATES['next_hop_group'].format(
+            network_instance=network_instance,
+            nhg_id='*'
+        ))
+        nhg_data = state.server_data_store.get_data(nhg_path, recursive=True)
+        for nhg in nhg_data.get_descendants('/network-instance/route-table/next-hop-group'):
+            tables['groups'][nhg.index] = self._get_resolved_next_hop_ids(nhg)
+
+        nh_path = build_path(self.PATH_TEMPLATES['next_hop'].format(
+            network_instance=network_instance,
+            nh_id='*'
+        ))
+        nh_data = state.server_data_store.get_data(nh_path, recursive=True)
+        for next_hop in nh_data.get_descendants('/network-instance/route-table/next-hop'):
+            tables['next_hops'][next_hop.index] = next_hop
+        return tables
+
+    def _get_next_hop(self, state, network_instance, next_hop_id):
+        """Get a next-hop entry from the bulk table or with a per-id query"""
+        if self._bulk_next_hops:
+            next_hop = self._get_next_hop_tables(state, network_instance)['next_hops'].get(next_hop_id)
+            if next_hop is not None:
+                return next_hop
+
+        nh_path = build_path(self.PATH_TEMPLATES['next_hop'].format(
+            network_instance=network_instance,
+            nh_id=next_hop_id
+        ))
+        nh_data = state.server_data_store.get_data(nh_path, recursive=True)
+        return nh_data.network_instance.get().route_table.get().next_hop.get()
+
+    def _get_next_hop_info(self, state, network_instance, next_hop_id, depth=0):
+        """Get detailed next-hop information, memoized per next-hop id"""
+        key = (network_instance, next_hop_id)
+        if key in self._next_hop_info_cache:
+            return self._next_hop_info_cache[key]
+
+        next_hop_info = None
         try:
-            nh_path = build_path(self.PATH_TEMPLATES['next_hop'].format(
-                network_instance=network_instance,
-                nh_id=next_hop_id
-            ))
-            nh_data = state.server_data_store.get_data(nh_path, recursive=True)
-            next_hop = nh_data.network_instance.get().route_table.get().next_hop.get()
+            next_hop = self._get_next_hop(state, network_instance, next_hop_id)
 
             subinterface = None
             if getattr(next_hop, 'type', '') == 'indirect' and hasattr(next_hop, 'resolving_route'):
-                subinterface = self._get_resolving_route_interface(state, network_instance, next_hop.resolving_route)
+                subinterface = self._get_resolving_route_interface(state, network_instance, next_hop.resolving_route, depth + 1)
             else:
                 subinterface = getattr(next_hop, 'subinterface', None)
 
             if hasattr(next_hop, 'ip_address'):
-                return {
+                next_hop_info = {
                     'ip': next_hop.ip_address,
                     'interface': subinterface or ''
                 }
         except Exception as e:
             pass
-        return None
+        self._next_hop_info_cache[key] = next_hop_info
+        return next_hop_info
 
-    def _get_resolving_route_interface(self, state, network_instance, resolving_route):
+    def _get_resolving_route_interface(self, state, network_instance, resolving_route, depth=1):
         """Follow next-hop chain recursively until finding the interface"""
         try:
             resolving_route_data = resolving_route.get()
+            key = (network_instance, resolving_route_data.ip_prefix,
+                   resolving_route_data.route_type, resolving_route_data.route_owner)
+        except Exception:
+            return None
+
+        if key in self._resolving_route_cache:
+            return self._resolving_route_cache[key]
+        # A route resolving through itself or a runaway chain ends unresolved
+        if key in self._resolving_routes_in_progress or depth > self.MAX_RESOLUTION_DEPTH:
+            return None
+
+        interface = None
+        self._resolving_routes_in_progress.add(key)
+        try:
+            # IPv4 routes can resolve over IPv6 routes and vice versa
+            afi, prefix_key, table_attr = self.ROUTE_TABLES['ipv6' if ':' in resolving_route_data.ip_prefix else 'ipv4'][:3]
             route_path = build_path(self.PATH_TEMPLATES['route_detail'].format(
                 network_instance=network_instance,
+                afi=afi,
+                prefix_key=prefix_key,
                 ip_prefix=resolving_route_data.ip_prefix,
                 route_type=resolving_route_data.route_type,
                 route_owner=resolving_route_data.route_owner
             ))
             
             route_data = state.server_data_store.get_data(route_path, recursive=True)
-            nhg_id = route_data.network_instance.get().route_table.get().ipv4_unicast.get().route.get().next_hop_group
+            route_table = route_data.network_instance.get().route_table.get()
+            nhg_id = getattr(route_table, table_attr).get().route.get().next_hop_group
 
-            next_hops = self._get_next_hops(state, network_instance, nhg_id)
+            next_hops = self._get_next_hops(state, network_instance, nhg_id, depth)
             for nh in next_hops:
                 if nh.get('interface'):
-                    return nh['interface']
+                    interface = nh['interface']
+                    break
 
         except Exception:
             pass
-        return None
+        finally:
+            self._resolving_routes_in_progress.discard(key)
+        self._resolving_route_cache[key] = interface
+        return interface
 
     def _format_uptime(self, route):
         """Extract and format uptime for a route"""
@@ -236,10 +751,10 @@ class IpRouteReport:
             return 'C'
         return self.ROUTE_CODES.get(route_type.lower(), '?')
 
-    def _display_routes(self, routes, network_instance):
+    def _display_routes(self, routes, network_instance, default_prefix='0.0.0.0/0'):
         """Display formatted routes"""
         # Check for default route
-        default_route_exists = any(route['prefix'] == '0.0.0.0/0' for route in routes)
+        default_route_exists = any(route['prefix'] == default_prefix for route in routes)
         if not default_route_exists:
             print("Gateway of last resort is not set")
 
@@ -258,29 +773,18 @@ class IpRouteReport:
             self._display_route_with_next_hops(route)
 
     def _display_route_with_next_hops(self, route):
-        """Display route with its next-hops"""
-        if len(route['next_hops']) > 1:
-            # First next-hop
-            first_hop = route['next_hops'][0]
-            self._print_next_hop(route, first_hop, is_first=True)
-            
-            # Additional next-hops
-            for next_hop in route['next_hops'][1:]:
-                self._print_next_hop(route, next_hop, is_first=False)
-        else:
-            # Single next-hop
-            self._print_next_hop(route, route['next_hops'][0], is_first=True)
-
-    def _print_next_hop(self, route, next_hop, is_first):
-        """Print a single next-hop entry"""
-        if is_first:
-            line = f"{route['code']}    {route['prefix']} [{route['preference']}/{route['metric']}] via {next_hop['ip']}"
+        """Display route with its next-hops from the line template of its next-hop-group"""
+        template = self._next_hop_block_cache.get(route['next_hop_group'])
+        if template is None:
+            self._next_hop_block_misses += 1
+            # Preference, metric and uptime belong to the route and are left as slots
+            template = '\n'.join(
+                ("{code}    {prefix} " if i == 0 else "           ")
+                + f"[{{preference}}/{{metric}}] via {next_hop['ip']}{{uptime}}"
+                + (f", {next_hop['interface']}" if next_hop['interface'] else "")
+                for i, next_hop in enumerate(route['next_hops']))
+            self._next_hop_block_cache[route['next_hop_group']] = template
         else:
-            line = f"           [{route['preference']}/{route['metric']}] via {next_hop['ip']}"
-            
-        if route['uptime']:
-            line += f", {route['uptime']}"
-        if next_hop['interface']:
-            line += f", {next_hop['interface']}"
-            
-        print(line)
\ No newline at end of file
+            self._next_hop_block_hits += 1
+        print(template.format(code=route['code'], prefix=route['prefix'], preference=route['preference'],
+                              metric=route['metric'], uptime=f", {route['uptime']}" if route['uptime'] else ""))
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Prefix helpers for the Cisco-style route reports
+Provides a binary prefix trie used for longest-prefix-match and
+longer-prefixes lookups on route table keys
+"""
+from socket import inet_aton
+import ipaddress
+
+
+class PrefixTrie:
+    """Binary trie of IP prefixes keyed by (network address, prefix length)."""
+
+    # Node layout: [child for bit 0, child for bit 1, values stored at this prefix]
+    __slots__ = ('_root', '_max_length', 'size')
+
+    def __init__(self, max_length=32):
+        self._root = [None, None, None]
+        self._max_length = max_length
+        self.size = 0
+
+    def insert(self, network, length, value):
+        """Store value under network/length, several values may share a prefix"""
+        node = self._root
+        shift = self._max_length - 1
+        for _ in range(length):
+            bit = (network >> shift) & 1
+            child = node[bit]
+            if child is None:
+                child = node[bit] = [None, None, None]
+            node = child
+            shift -= 1
+        if node[2] is None:
+            node[2] = []
+        node[2].append(value)
+        self.size += 1
+
+    def longest_match(self, address):
+        """Return the values of the longest prefix covering address, or an empty list"""
+        node = self._root
+        best = node[2]
+        shift = self._max_length - 1
+        while shift >= 0:
+            node = node[(address >> shift) & 1]
+            if node is None:
+                break
+            if node[2] is not None:
+                best = node[2]
+            shift -= 1
+        return best or []
+
+    def longer_prefixes(self, network, length):
+        """Yield the values of network/length and of every more specific prefix"""
+        node = self._root
+        shift = self._max_length - 1
+        for _ in range(length):
+            node = node[(network >> shift) & 1]
+            if node is None:
+                return
+            shift -= 1
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node[2] is not None:
+                yield from node[2]
+            # Push bit 1 first so bit 0 (lower addresses) is visited first
+            if node[1] is not None:
+                stack.append(node[1])
+            if node[0] is not None:
+                stack.append(node[0])
+
+
+def prefix_sort_key(prefix):
+    """Return (network address << 8) | prefix length, ordering prefixes by address then length"""
+    address, _, length = prefix.partition('/')
+    if ':' in address:
+        return (int(ipaddress.IPv6Address(address)) << 8) | int(length or 128)
+    return (int.from_bytes(inet_aton(address), 'big') << 8) | int(length or 32)
+
+
+def parse_prefix(prefix):
+    """Return (network address as int, prefix length, max length) of an IPv4 or IPv6 prefix"""
+    network = ipaddress.ip_network(prefix, strict=False)
+    return int(network.network_address), network.prefixlen, network.max_prefixlen
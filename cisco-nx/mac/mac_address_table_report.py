@@ -28,6 +28,12 @@ import re
 #logger = logging.getLogger(__name__)
 #logger.level = logging.DEBUG
 
+SUBINTERFACE_RE = re.compile(r'(.+)\.(\d+)')
+VXLAN_INTERFACE_RE = re.compile(r'vxlan[\d.]+')
+FIRST_WORD_RE = re.compile(r'^\S+')
+ESI_RE = re.compile(r'esi:([\dA-Fa-f:]+)')
+VTEP_RE = re.compile(r'vtep:([\dA-Fa-f:.]+)')
+
 class MacAddressTableReport:
     '''
         'show mac address-table' : Gives all MAC Table entries
@@ -43,6 +49,10 @@ class MacAddressTableReport:
         """Main display function"""
         self._state = state
         self._arguments = arguments
+        self._destination_cache = {}
+        self._subinterface_vlan_dict = None
+        self._vxlan_vni_dict = None
+        self._irb_macs = None
         if arguments.has_node('instance'):
             netinst_data = self._fetch_state_network(arguments.get('instance','name'))
         elif arguments.has_node('interface'):
@@ -89,15 +99,11 @@ class MacAddressTableReport:
         )
         return self._state.server_data_store.stream_data(table_path, recursive=True)
 
-    def _fetch_state_subinterface(self, int_name, subint_index):
-        table_path = build_path(
-            '/interface[name={name}]/subinterface[index={index}]',
-            name=int_name,
-            index=str(subint_index)
-        )
+    def _fetch_state_subinterface_vlans(self):
+        table_path = build_path('/interface[name=*]/subinterface[index=*]/vlan')
         return self._state.server_data_store.get_data(table_path, recursive=True, include_container_children=True)
 
-    def _fetch_state_tunnel_interface(self, tunnel_name, tunnel_index):
+    def _fetch_state_tunnel_interface(self, tunnel_name='*', tunnel_index='*'):
         table_path = build_path(
             '/tunnel-interface[name={name}]/vxlan-interface[index={index}]/ingress/vni',
             name=tunnel_name,
@@ -105,14 +111,14 @@ class MacAddressTableReport:
         )
         return self._state.server_data_store.get_data(table_path, recursive=False, include_container_children=True)
 
-    def _fetch_state_int_hw_mac(self, int_name):
+    def _fetch_state_int_hw_mac(self, int_name='*'):
         table_path = build_path(
             '/interface[name={name}]/ethernet/hw-mac-address',
             name=int_name
         )
         return self._state.server_data_store.stream_data(table_path, recursive=False, include_container_children=True)
 
-    def _fetch_state_irb_subinterface_anycast_mac(self, int_name, subint_index):
+    def _fetch_state_irb_subinterface_anycast_mac(self, int_name='*', subint_index='*'):
         table_path = build_path(
             '/interface[name={name}]/subinterface[index={index}]/anycast-gw/anycast-gw-mac',
             name=int_name,
@@ -128,18 +134,41 @@ class MacAddressTableReport:
         )
         return self._state.server_data_store.stream_data(table_path, recursive=False)
 
+    def _get_mac_aging_from_netinst(self, netinst_name):
+        # one wildcard query per mac-vrf instead of one query per MAC
+        mac_aging_dict = {}
+        mac_learn_data = self._fetch_state_mac_learning(netinst_name)
+        for mac_learnt_entry in mac_learn_data.get_descendants(
+                '/network-instance/bridge-table/mac-learning/learnt-entries/mac'):
+            mac_aging_dict[mac_learnt_entry.address] = mac_learnt_entry.aging
+        return mac_aging_dict
+
     def _get_vni_from_netinst_data (self, network_vxlan_interface_data):
-        vxlan_interface_name_index_list=[]
+        # vxlan subinterface ("vxlan1.110") -> vni
+        vxlan_subint_vni_dict = {}
+        vxlan_vni_dict = self._get_vxlan_vni_dict()
         for network_vxlan_interface_entry in network_vxlan_interface_data.get_descendants('/network-instance/vxlan-interface'):
-            vxlan_interface_name, subint_index = network_vxlan_interface_entry.name.split('.', 1)
-            tunnel_interface_data = self._fetch_state_tunnel_interface(vxlan_interface_name, subint_index)
-            for vxlan_int in tunnel_interface_data.get_descendants('/tunnel-interface/vxlan-interface'):
+            vxlan_subint = network_vxlan_interface_entry.name
+            if vxlan_subint in vxlan_vni_dict:
+                vxlan_subint_vni_dict[vxlan_subint] = vxlan_vni_dict[vxlan_subint]
+        return vxlan_subint_vni_dict
+
+    def _get_vxlan_vni_dict(self):
+        # "vxlanN.M" -> ingress vni of every vxlan-interface, fetched once per command
+        if self._vxlan_vni_dict is not None:
+            return self._vxlan_vni_dict
+
+        self._vxlan_vni_dict = {}
+        tunnel_interface_data = self._fetch_state_tunnel_interface()
+        for tunnel_interface in tunnel_interface_data.tunnel_interface.items():
+            for vxlan_int in tunnel_interface.vxlan_interface.items():
                 vni = vxlan_int.ingress.get().vni
-                vxlan_interface_name_index_list.append({"name": vxlan_interface_name, "index": str(subint_index), "vni": str(vni)})
-        return vxlan_interface_name_index_list
+                self._vxlan_vni_dict[f'{tunnel_interface.name}.{vxlan_int.index}'] = str(vni)
+        return self._vxlan_vni_dict
 
     def _get_interface_name_index_from_netinstance_data(self,  network_interface_data  ):
-        interface_name_index_list=[]
+        # (interface name, subinterface index) -> vlan tagging
+        interface_name_index_dict = {}
         for network_interface_entry in network_interface_data.get_descendants('/network-instance/interface'):
             # get interface name and index for cases with interface-ref and without it
             if "interface-ref" in network_interface_entry.child_names:
@@ -156,27 +185,64 @@ class MacAddressTableReport:
             if any(sub in interface_name for sub in ["irb", "lo"]):
                 continue
 
-            # get vlan information from interface
-            subinterface_data = self._fetch_state_subinterface(interface_name, subint_index)
-            for subinterface in subinterface_data.get_descendants('/interface/subinterface'):
+            # get vlan information from the subinterface index shared by all mac-vrfs,
+            # subinterfaces without vlan state keep no entry and print as "-"
+            subinterface_key = (interface_name, str(subint_index))
+            subinterface_vlan_dict = self._get_subinterface_vlan_dict()
+            if subinterface_key in subinterface_vlan_dict:
+                interface_name_index_dict[subinterface_key] = subinterface_vlan_dict[subinterface_key]
+
+        return interface_name_index_dict
+
+    def _get_subinterface_vlan_dict(self):
+        # (interface name, subinterface index) -> vlan tagging of every subinterface, fetched once per command
+        if self._subinterface_vlan_dict is not None:
+            return self._subinterface_vlan_dict
+
+        self._subinterface_vlan_dict = {}
+        subinterface_data = self._fetch_state_subinterface_vlans()
+        for interface in subinterface_data.interface.items():
+            for subinterface in interface.subinterface.items():
                 vlan_encap = subinterface.vlan.get().encap.get()
                 if vlan_encap.single_tagged.exists():
                     vlan = vlan_encap.single_tagged.get().vlan_id
                     tagging = vlan if vlan else 'null'
-                    interface_name_index_list.append({"name": interface_name, "index": str(subint_index), "tagging": str(tagging)})
                 elif self._state.system_features.dot1q_vlan_ranges and vlan_encap.single_tagged_range.exists():
                     vlan_ranges = vlan_encap.single_tagged_range.get()
-                    tag_ranges = ','.join(f'{entry.range_low_vlan_id}-{entry.high_vlan_id}' for entry in vlan_ranges.low_vlan_id.items())
-                    interface_name_index_list.append({"name": interface_name, "index": str(subint_index), "tagging": str(tag_ranges)})
+                    tagging = ','.join(f'{entry.range_low_vlan_id}-{entry.high_vlan_id}' for entry in vlan_ranges.low_vlan_id.items())
                 elif vlan_encap.untagged.exists():
-                    interface_name_index_list.append({"name": interface_name, "index": str(subint_index), "tagging": "untagged"})
+                    tagging = "untagged"
                 else:
-                    interface_name_index_list.append({"name": interface_name, "index": str(subint_index), "tagging": "null"})
+                    tagging = "null"
+                self._subinterface_vlan_dict[(interface.name, str(subinterface.index))] = str(tagging)
+        return self._subinterface_vlan_dict
+
+    def _get_irb_macs(self):
+        # irb hw-macs by interface and anycast-gw-macs by (interface, index), fetched once per command
+        if self._irb_macs is not None:
+            return self._irb_macs
+
+        hw_mac_dict = {}
+        hw_mac_data = self._fetch_state_int_hw_mac()
+        for interface in hw_mac_data.interface.items():
+            if "irb" in interface.name:
+                hw_mac_dict[interface.name] = interface.ethernet.get().hw_mac_address
+
+        anycast_gw_mac_dict = {}
+        anycast_gw_mac_data = self._fetch_state_irb_subinterface_anycast_mac()
+        for interface in anycast_gw_mac_data.interface.items():
+            if not "irb" in interface.name:
+                continue
+            for subinterface in interface.subinterface.items():
+                anycast_gw_mac_dict[(interface.name, str(subinterface.index))] = subinterface.anycast_gw.get().anycast_gw_mac
 
-        return interface_name_index_list
+        self._irb_macs = (hw_mac_dict, anycast_gw_mac_dict)
+        return self._irb_macs
 
     def _get_irbs_from_netinstance_data(self, network_interface_data):
-        interface_name_index_list=[]
+        # irb hw-mac or anycast-gw-mac -> (irb interface, index)
+        irb_mac_dict = {}
+        hw_mac_dict, anycast_gw_mac_dict = self._get_irb_macs()
         for network_interface_entry in network_interface_data.get_descendants('/network-instance/interface'):
             # get interface name and index for cases with interface-ref and without it
             if "interface-ref" in network_interface_entry.child_names:
@@ -193,33 +259,23 @@ class MacAddressTableReport:
             if not "irb" in interface_name:
                 continue
 
-            hw_mac_data = self._fetch_state_int_hw_mac(interface_name)
-            anycast_gw_mac_data = self._fetch_state_irb_subinterface_anycast_mac(interface_name, subint_index)
-
-            if anycast_gw_mac_data.get("interface").exists():
-                anycast_gw_mac = anycast_gw_mac_data.interface.get().subinterface.get().anycast_gw.get().anycast_gw_mac
-            else:
-                anycast_gw_mac = ""
+            hw_mac = hw_mac_dict.get(interface_name, "")
+            anycast_gw_mac = anycast_gw_mac_dict.get((interface_name, str(subint_index)), "")
 
-            hw_mac = hw_mac_data.interface.get().ethernet.get().hw_mac_address
-            interface_name_index_list.append({"name": interface_name, "index": str(subint_index), "hw_mac": hw_mac, "anycast_gw_mac": anycast_gw_mac})
+            # the first irb subinterface owning a MAC wins, as with the former list scan
+            for irb_mac in (hw_mac, anycast_gw_mac):
+                if irb_mac:
+                    irb_mac_dict.setdefault(irb_mac, (interface_name, str(subint_index)))
 
-        return interface_name_index_list
+        return irb_mac_dict
 
     def _find_vlan(self, interfaces, query):
         # Extract interface name and index using regex
-        match = re.match(r'(.+)\.(\d+)', query)
+        match = SUBINTERFACE_RE.match(query)
         if not match:
             return "-"
 
-        interface_name, index = match.groups()
-        index = str(index)
-
-        # Search for the matching interface
-        for entry in interfaces:
-            if entry["name"] == interface_name and entry["index"] == index:
-                return entry["tagging"]
-        return "-"
+        return interfaces.get(match.groups(), "-")
 
     def _get_mac_code(self, mac_type):
         if mac_type=="learnt":
@@ -234,21 +290,34 @@ class MacAddressTableReport:
         static_dynamic =  "dynamic" if mac_type=="evpn" or mac_type=="learnt" else "static"
         return static_dynamic
 
-    def _get_logical_interface(self, mac_entry_destination):
-        match_vxlan_interface = re.search(r'vxlan[\d.]+', mac_entry_destination)
-        match_else = re.search(r'^\S+',mac_entry_destination)
+    def _parse_destination(self, mac_entry_destination):
+        # returns (logical interface, vxlan subinterface, esi, vtep), each destination string is parsed once
+        parsed = self._destination_cache.get(mac_entry_destination)
+        if parsed is not None:
+            return parsed
+
+        match_vxlan_interface = VXLAN_INTERFACE_RE.search(mac_entry_destination)
+        match_else = FIRST_WORD_RE.search(mac_entry_destination)
+        esi_match = ESI_RE.search(mac_entry_destination)
+        match_ip_vtep = VTEP_RE.search(mac_entry_destination)
 
-        if match_vxlan_interface:
-            logical_interface = match_vxlan_interface.group()
+        vxlan_subint = match_vxlan_interface.group() if match_vxlan_interface else ""
+        if vxlan_subint:
+            logical_interface = vxlan_subint
         elif match_else:
             logical_interface = match_else.group()
         else:
             logical_interface = ""
 
-        return logical_interface
+        parsed = (logical_interface,
+                  vxlan_subint,
+                  esi_match.group(1) if esi_match else "",
+                  match_ip_vtep.group(1) if match_ip_vtep else "")
+        self._destination_cache[mac_entry_destination] = parsed
+        return parsed
 
 
-    def _get_port_info(self, mac_entry_address, mac_entry_destination, mac_entry_destination_type, irb_interface_name_index_list):
+    def _get_port_info(self, mac_entry_address, mac_entry_destination, mac_entry_destination_type, irb_mac_dict):
         # returns:
         # "destination ethernet-1/11.110" -> ethernet-1/11.110
         # "vxlan-interface:vxlan1.110 vtep:192.168.255.2 vni:110" -> vxlan1.110(192.168.255.2)
@@ -256,37 +325,31 @@ class MacAddressTableReport:
         # destination irb -> irb1.3
         # "" as fallback
 
+        logical_interface, vxlan_subint, esi, vtep = self._parse_destination(mac_entry_destination)
+
         if mac_entry_destination_type =="vxlan":
-            esi_match = re.search(r'esi:([\dA-Fa-f:]+)', mac_entry_destination)
-            match_ip_vtep = re.search(r'vtep:([\dA-Fa-f:.]+)', mac_entry_destination)
-            match_vxlan_interface = re.search(r'vxlan[\d.]+', mac_entry_destination)
-            if match_vxlan_interface and esi_match:
-                return f'{match_vxlan_interface.group()}({esi_match.group(1)})'
-            if match_vxlan_interface and match_ip_vtep:
-                return f'{match_vxlan_interface.group()}({match_ip_vtep.group(1)})'
+            if vxlan_subint and esi:
+                return f'{vxlan_subint}({esi})'
+            if vxlan_subint and vtep:
+                return f'{vxlan_subint}({vtep})'
 
         if mac_entry_destination_type =="sub-interface":
-            match_all = re.search(r'^\S+',mac_entry_destination)
-            return f'{match_all.group()}'
+            return logical_interface
 
         if mac_entry_destination_type =="irb-interface":
-            for irb in irb_interface_name_index_list:
-                if irb["hw_mac"] == mac_entry_address or irb["anycast_gw_mac"] == mac_entry_address:
-                    return f'{irb["name"]}.{irb["index"]}(R)'
+            irb = irb_mac_dict.get(mac_entry_address)
+            if irb:
+                return f'{irb[0]}.{irb[1]}(R)'
             return f'irb(R)'
 
         return ""
 
-    def _get_vni(self, mac_entry_destination , vxlan_interface_name_vni_list):
+    def _get_vni(self, mac_entry_destination , vxlan_subint_vni_dict):
         # vni info is filled in "destination" state data but not for the case of ESI
         # we use local vni from vxlan-interface config to fill vni data
-        match_vxlan_interface = re.search(r'vxlan[\d.]+', mac_entry_destination)
-        if match_vxlan_interface:
-            vxlan_subint =  match_vxlan_interface.group()
-            for vxlan in vxlan_interface_name_vni_list:
-                vxlan_subint_from_config = f'{vxlan["name"]}.{vxlan["index"]}'
-                if vxlan_subint == vxlan_subint_from_config:
-                    return vxlan["vni"]
+        vxlan_subint = self._parse_destination(mac_entry_destination)[1]
+        if vxlan_subint:
+            return vxlan_subint_vni_dict.get(vxlan_subint, "")
 
         return ""
 
@@ -305,16 +368,17 @@ class MacAddressTableReport:
             mac_data = self._fetch_state_mac_table(netinst.name)
             network_interface_data = self._fetch_state_network_interfaces(netinst.name)
             network_vxlan_interface_data = self._fetch_state_network_vxlan_interfaces(netinst.name)
-            irb_interface_name_index_list = self._get_irbs_from_netinstance_data(network_interface_data)
-            vxlan_interface_name_vni_list = self._get_vni_from_netinst_data ( network_vxlan_interface_data)
-            interface_name_index_list = self._get_interface_name_index_from_netinstance_data ( network_interface_data)
+            irb_mac_dict = self._get_irbs_from_netinstance_data(network_interface_data)
+            vxlan_subint_vni_dict = self._get_vni_from_netinst_data ( network_vxlan_interface_data)
+            interface_name_index_dict = self._get_interface_name_index_from_netinstance_data ( network_interface_data)
+            mac_aging_dict = self._get_mac_aging_from_netinst(netinst.name)
 
             for mac_entry in mac_data.get_descendants('/network-instance/bridge-table/mac-table/mac'):
-                logical_subinterface = self._get_logical_interface(mac_entry.destination)
-                port_info = self._get_port_info(mac_entry.address, mac_entry.destination, mac_entry.destination_type, irb_interface_name_index_list)
+                logical_subinterface = self._parse_destination(mac_entry.destination)[0]
+                port_info = self._get_port_info(mac_entry.address, mac_entry.destination, mac_entry.destination_type, irb_mac_dict)
                 logical_interface = logical_subinterface.split('.')[0] if logical_subinterface else None
-                vlan = self._find_vlan(interface_name_index_list, logical_subinterface)
-                vni = self._get_vni(mac_entry.destination, vxlan_interface_name_vni_list)
+                vlan = self._find_vlan(interface_name_index_dict, logical_subinterface)
+                vni = self._get_vni(mac_entry.destination, vxlan_subint_vni_dict)
 
                 # if an interface (without the "".subint") is given as argument we populate the mac table for all its subinterfaces
                 if subinterface_name is not None and subinterface_name != logical_subinterface:
@@ -325,11 +389,7 @@ class MacAddressTableReport:
                 if vni_value is not None and vni_value != vni:
                      continue
 
-                mac_aging = 'NA'
-                mac_learn_data = self._fetch_state_mac_learning(netinst.name, mac_entry.address)
-                for mac_learnt_entry in mac_learn_data.get_descendants(
-                        '/network-instance/bridge-table/mac-learning/learnt-entries/mac'):
-                    mac_aging = mac_learnt_entry.aging
+                mac_aging = mac_aging_dict.get(mac_entry.address, 'NA')
 
                 mac_flags = self._get_mac_code(mac_entry.type)
                 mac_ports = port_info
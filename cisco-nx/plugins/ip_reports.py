@@ -41,9 +41,11 @@ class Plugin(CliPlugin):
         # Create top-level ip command
         ip_cmd = cli.show_mode.add_command(Syntax('ip'))
         
-        # Add route command
+        # Add route command, optionally for a single address or prefix
         route_cmd = ip_cmd.add_command(
-            Syntax('route'),
+            Syntax('route')
+            .add_unnamed_argument('address', default='*', help='IPv4 address (longest match) or IPv4 prefix (exact match)')
+            .add_named_argument('debug', default='false', choices=['true', 'false'], help='print timing and cache counters'),
             callback=self._show_ip_route
         )
 
@@ -55,6 +57,113 @@ class Plugin(CliPlugin):
             update_location=False
         )
 
+        # Add 'summary' subcommand with per protocol counters only
+        route_summary_cmd = route_cmd.add_command(
+            Syntax('summary', help='Display route and path counters per protocol'),
+            callback=self._show_ip_route_summary,
+            update_location=False
+        )
+        route_summary_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_route_summary,
+            update_location=False
+        )
+
+        # Add 'longer-prefixes' subcommand for a prefix and its more specifics
+        longer_prefixes_cmd = route_cmd.add_command(
+            Syntax('longer-prefixes', help='Display the prefix and all more specific routes'),
+            callback=self._show_ip_route_longer_prefixes,
+            update_location=False
+        )
+        longer_prefixes_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_route_longer_prefixes,
+            update_location=False
+        )
+
+        # Add per protocol subcommands, filtered by route-type on the server
+        for protocol in IpRouteReport.ROUTE_PROTOCOLS:
+            protocol_cmd = route_cmd.add_command(
+                Syntax(protocol, help=f'Display {protocol} routes'),
+                callback=self._show_ip_route_protocol,
+                update_location=False
+            )
+            protocol_cmd.add_command(
+                Syntax('vrf')
+                .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+                callback=self._show_vrf_route_protocol,
+                update_location=False
+            )
+
+        # Add 'stream' subcommand printing routes in datastore order as they arrive
+        stream_cmd = route_cmd.add_command(
+            Syntax('stream', help='Display routes unsorted as they are received'),
+            callback=self._show_ip_route_stream,
+            update_location=False
+        )
+        stream_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_route_stream,
+            update_location=False
+        )
+
+        # Add 'watch' subcommand printing route changes between polls
+        watch_cmd = route_cmd.add_command(
+            Syntax('watch', help='Display route additions, removals and next-hop changes')
+            .add_named_argument('interval', default='5', help='seconds between polls')
+            .add_named_argument('count', default='0', help='number of polls, 0 until interrupted'),
+            callback=self._show_ip_route_watch,
+            update_location=False
+        )
+        watch_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_route_watch,
+            update_location=False
+        )
+
+        # Add 'all-afi' subcommand showing IPv4 and IPv6 routes from one next-hop fetch
+        all_afi_cmd = route_cmd.add_command(
+            Syntax('all-afi', help='Display IPv4 and IPv6 routes'),
+            callback=self._show_ip_route_all_afi,
+            update_location=False
+        )
+        all_afi_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_route_all_afi,
+            update_location=False
+        )
+
+        # Create top-level ipv6 command with its route command
+        ipv6_cmd = cli.show_mode.add_command(Syntax('ipv6'))
+        ipv6_route_cmd = ipv6_cmd.add_command(
+            Syntax('route', help='Display IPv6 routes'),
+            callback=self._show_ipv6_route
+        )
+        ipv6_route_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_ipv6_route,
+            update_location=False
+        )
+        ipv6_watch_cmd = ipv6_route_cmd.add_command(
+            Syntax('watch', help='Display IPv6 route additions, removals and next-hop changes')
+            .add_named_argument('interval', default='5', help='seconds between polls')
+            .add_named_argument('count', default='0', help='number of polls, 0 until interrupted'),
+            callback=self._show_ipv6_route_watch,
+            update_location=False
+        )
+        ipv6_watch_cmd.add_command(
+            Syntax('vrf')
+            .add_unnamed_argument('vrf_name', suggestions=KeyCompleter('/network-instance[name=*]')),
+            callback=self._show_vrf_ipv6_route_watch,
+            update_location=False
+        )
+
         # Add interface command
         interface_cmd = ip_cmd.add_command(
             Syntax('interface')
@@ -93,15 +202,153 @@ class Plugin(CliPlugin):
     def _show_ip_route(self, state, arguments, output, **_kwargs):
         if state.is_intermediate_command:
             return
-        IpRouteReport()._show_routes(state, output, network_instance='default')
+        self._show_route(state, arguments, output, 'default')
         output.print_line(f'\nTry SR Linux command: show network-instance default route-table')
     def _show_vrf_route(self, state, arguments, output, **_kwargs):
         if state.is_intermediate_command:
             return
         network_instance = arguments.get('vrf_name')
-        IpRouteReport()._show_routes(state, output, network_instance=network_instance)
+        self._show_route(state, arguments, output, network_instance)
+        output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table')
+
+    def _show_ip_route_longer_prefixes(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._show_route(state, arguments, output, 'default', longer_prefixes=True)
+        output.print_line(f'\nTry SR Linux command: show network-instance default route-table')
+
+    def _show_vrf_route_longer_prefixes(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        network_instance = arguments.get('vrf', 'vrf_name')
+        self._show_route(state, arguments, output, network_instance, longer_prefixes=True)
+        output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table')
+
+    def _show_ip_route_summary(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        IpRouteReport()._show_route_summary(state, output, network_instance='default')
+        output.print_line(f'\nTry SR Linux command: show network-instance default route-table summary')
+
+    def _show_vrf_route_summary(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        network_instance = arguments.get('vrf', 'vrf_name')
+        IpRouteReport()._show_route_summary(state, output, network_instance=network_instance)
+        output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table summary')
+
+    def _show_ip_route_stream(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        # Next hops are fetched per group on first use instead of as whole tables up front
+        IpRouteReport(bulk_next_hops=False)._stream_routes(state, output, network_instance='default')
+        output.print_line(f'\nTry SR Linux command: show network-instance default route-table')
+
+    def _show_vrf_route_stream(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        network_instance = arguments.get('vrf', 'vrf_name')
+        IpRouteReport(bulk_next_hops=False)._stream_routes(state, output, network_instance=network_instance)
+        output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table')
+
+    def _show_ip_route_watch(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._watch_route(state, arguments, output, 'default')
+
+    def _show_vrf_route_watch(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._watch_route(state, arguments, output, arguments.get('vrf', 'vrf_name'))
+
+    def _show_ipv6_route_watch(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._watch_route(state, arguments, output, 'default', afi='ipv6')
+
+    def _show_vrf_ipv6_route_watch(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._watch_route(state, arguments, output, arguments.get('vrf', 'vrf_name'), afi='ipv6')
+
+    def _watch_route(self, state, arguments, output, network_instance, afi='ipv4'):
+        interval = self._get_count_argument(arguments, 'watch', 'interval')
+        count = self._get_count_argument(arguments, 'watch', 'count')
+        if interval < 1:
+            raise ExecuteError(f"Invalid interval '{interval}', expected at least 1 second")
+        # Only added and changed routes are resolved, per next-hop-group
+        IpRouteReport(bulk_next_hops=False)._watch_routes(state, output, network_instance, interval=interval, count=count, afi=afi)
+
+    def _get_count_argument(self, arguments, command, name):
+        value = arguments.get(command, name)
+        try:
+            count = int(value)
+        except (TypeError, ValueError):
+            raise ExecuteError(f"Invalid {name} '{value}', expected a non-negative integer")
+        if count < 0:
+            raise ExecuteError(f"Invalid {name} '{value}', expected a non-negative integer")
+        return count
+
+    def _show_ip_route_all_afi(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        IpRouteReport()._show_all_afi_routes(state, output, network_instance='default')
+        output.print_line(f'\nTry SR Linux command: show network-instance default route-table')
+
+    def _show_vrf_route_all_afi(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        network_instance = arguments.get('vrf', 'vrf_name')
+        IpRouteReport()._show_all_afi_routes(state, output, network_instance=network_instance)
+        output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table')
+
+    def _show_ipv6_route(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        IpRouteReport()._show_routes(state, output, network_instance='default', afi='ipv6')
+        output.print_line(f'\nTry SR Linux command: show network-instance default route-table ipv6-unicast summary')
+
+    def _show_vrf_ipv6_route(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        network_instance = arguments.get('vrf_name')
+        IpRouteReport()._show_routes(state, output, network_instance=network_instance, afi='ipv6')
+        output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table ipv6-unicast summary')
+
+    def _show_ip_route_protocol(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        self._show_protocol_route(state, arguments, output, 'default')
+        output.print_line(f'\nTry SR Linux command: show network-instance default route-table')
+
+    def _show_vrf_route_protocol(self, state, arguments, output, **_kwargs):
+        if state.is_intermediate_command:
+            return
+        network_instance = arguments.get('vrf', 'vrf_name')
+        self._show_protocol_route(state, arguments, output, network_instance)
         output.print_line(f'\nTry SR Linux command: show network-instance {network_instance} route-table')
 
+    def _show_protocol_route(self, state, arguments, output, network_instance):
+        if arguments.get('route', 'address') != '*':
+            raise ExecuteError('A protocol filter cannot be combined with an address')
+        protocol = next(p for p in IpRouteReport.ROUTE_PROTOCOLS if arguments.has_node(p))
+        # Only bgp is sized like the next-hop tables, other protocols resolve their groups one by one
+        IpRouteReport(bulk_next_hops=(protocol == 'bgp'))._show_routes(state, output, network_instance=network_instance, protocol=protocol)
+
+    def _show_route(self, state, arguments, output, network_instance, longer_prefixes=False):
+        address = arguments.get('route', 'address')
+        if address == '*':
+            if longer_prefixes:
+                raise ExecuteError("'longer-prefixes' requires an IPv4 prefix")
+            debug = arguments.get('route', 'debug') == 'true'
+            IpRouteReport(debug=debug)._show_routes(state, output, network_instance=network_instance)
+            return
+        try:
+            # A handful of routes is resolved per next-hop-group instead of from the bulk tables
+            IpRouteReport(bulk_next_hops=False)._show_route_lookup(state, output, network_instance, address, longer_prefixes=longer_prefixes)
+        except ValueError as e:
+            raise ExecuteError(f"Invalid address '{address}': {e}")
+
     def _show_ip_interface_brief(self, state, arguments, output, **_kwargs):
         if state.is_intermediate_command:
             return